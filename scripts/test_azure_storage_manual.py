@@ -3,6 +3,7 @@
 Test script for Azure Storage functionality
 """
 
+import logging
 import os
 import sys
 from datetime import datetime
@@ -203,4 +204,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Show the configuration details logged by print_config_info
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     sys.exit(main())
@@ -2,17 +2,26 @@
 Weekly working hours analysis functions
 """
 
+import functools
 from collections import defaultdict
+from datetime import date as Date
 from datetime import datetime
 from typing import Any
 
 from ..core.models import Employee, ShiftSchedule
 
 
+@functools.lru_cache(maxsize=4096)
+def _week_key_for_day(day: Date) -> str:
+    """Generate the week key for a calendar day"""
+    year, week_num, _ = day.isocalendar()
+    return f"{year}-W{week_num:02d}"
+
+
 def get_week_key(date: datetime) -> str:
     """Generate week key (year-week number) from date"""
-    year, week_num, _ = date.isocalendar()
-    return f"{year}-W{week_num:02d}"
+    # Shifts on the same day share one cached key
+    return _week_key_for_day(date.date())
 
 
 def is_full_time_employee(employee: Employee) -> bool:
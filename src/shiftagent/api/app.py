@@ -2,14 +2,35 @@
 FastAPI application instance and configuration
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from . import routes
 from .job_store import job_store
-from .jobs import job_lock, jobs
+from .jobs import (
+    JOB_REAP_INTERVAL_SECONDS,
+    evict_idle_jobs,
+    index_job,
+    job_lock,
+    jobs,
+    register_job,
+    start_store_writer,
+    stop_store_writer,
+)
+
+
+async def reap_idle_jobs():
+    """Periodically evict idle finished jobs from memory"""
+    while True:
+        await asyncio.sleep(JOB_REAP_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(evict_idle_jobs)
+        except Exception as e:
+            print(f"Error evicting idle jobs: {e}")
 
 
 @asynccontextmanager
@@ -19,24 +40,29 @@ async def lifespan(app: FastAPI):
     if job_store:
         print("Loading persisted jobs from storage...")
         try:
-            for job_id in job_store.list_jobs():
-                stored_job = job_store.get_job(job_id)
-                if stored_job:
-                    # Only load completed or failed jobs
-                    # (active jobs would have been interrupted)
-                    if stored_job.get("status") in [
-                        "SOLVING_COMPLETED",
-                        "SOLVING_FAILED",
-                    ]:
-                        with job_lock:
-                            jobs[job_id] = stored_job
+            # Index every persisted job, but only load completed or failed
+            # jobs (active jobs would have been interrupted)
+            for job_id, summary, stored_job in job_store.load_stored_jobs(
+                ("SOLVING_COMPLETED", "SOLVING_FAILED")
+            ):
+                index_job(job_id, summary)
+                if stored_job is not None:
+                    with job_lock:
+                        register_job(job_id, stored_job)
             print(f"Loaded {len(jobs)} jobs from storage")
         except Exception as e:
             print(f"Error loading persisted jobs: {e}")
 
+    start_store_writer()
+    reaper = asyncio.create_task(reap_idle_jobs())
+
     yield
 
-    # Shutdown: Nothing special needed as jobs are saved in real-time
+    # Shutdown: Stop the reaper, then the store writer once queued writes finish
+    reaper.cancel()
+    with suppress(asyncio.CancelledError):
+        await reaper
+    await asyncio.to_thread(stop_store_writer)
     print("Shutting down ShiftAgent API")
 
 
@@ -57,5 +83,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses such as solutions and HTML reports
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # Include router
 app.include_router(routes.router)
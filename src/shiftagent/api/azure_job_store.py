@@ -4,7 +4,9 @@ Azure Blob Storage implementation of JobStore
 
 import json
 import os
-from datetime import UTC, datetime
+from collections.abc import Container, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from azure.core.exceptions import ResourceNotFoundError
@@ -16,6 +18,9 @@ from ..core.models.schedule import ShiftSchedule
 from ..core.models.shift import Shift
 from .job_store import JobStore
 
+# Number of jobs downloaded concurrently by get_many
+GET_MANY_WORKERS = 8
+
 
 class AzureBlobJobStore(JobStore):
     """Azure Blob Storage job store implementation"""
@@ -122,7 +127,7 @@ class AzureBlobJobStore(JobStore):
         return Employee(
             id=emp_data["id"],
             name=emp_data["name"],
-            skills=set(emp_data["skills"]),
+            skills=frozenset(emp_data["skills"]),
             preferred_days_off=set(emp_data.get("preferred_days_off", [])),
             preferred_work_days=set(emp_data.get("preferred_work_days", [])),
             unavailable_dates={
@@ -145,7 +150,7 @@ class AzureBlobJobStore(JobStore):
             id=shift_data["id"],
             start_time=start_time,
             end_time=end_time,
-            required_skills=set(shift_data["required_skills"]),
+            required_skills=frozenset(shift_data["required_skills"]),
             location=shift_data["location"],
             priority=shift_data["priority"],
             pinned=shift_data.get("pinned", False),
@@ -189,6 +194,8 @@ class AzureBlobJobStore(JobStore):
             "status": job_data["status"],
             "created_at": self._serialize_datetime(job_data.get("created_at")),
             "completed_at": self._serialize_datetime(job_data.get("completed_at")),
+            # Kept so a reloaded job's solution ETag matches its latest change
+            "updated_at": self._serialize_datetime(job_data.get("updated_at")),
             "error": job_data.get("error"),
             # Don't serialize solver reference or other non-serializable objects
         }
@@ -215,7 +222,10 @@ class AzureBlobJobStore(JobStore):
             metadata={
                 "job_id": job_id,
                 "status": job_data["status"],
-                "created_at": str(job_data.get("created_at", "")),
+                "created_at": self._serialize_datetime(job_data.get("created_at"))
+                or "",
+                "completed_at": self._serialize_datetime(job_data.get("completed_at"))
+                or "",
             },
         )
 
@@ -235,6 +245,8 @@ class AzureBlobJobStore(JobStore):
                 data["created_at"] = self._deserialize_datetime(data["created_at"])
             if data.get("completed_at"):
                 data["completed_at"] = self._deserialize_datetime(data["completed_at"])
+            if data.get("updated_at"):
+                data["updated_at"] = self._deserialize_datetime(data["updated_at"])
 
             # Convert problem and solution back to domain objects
             if data.get("problem"):
@@ -249,6 +261,17 @@ class AzureBlobJobStore(JobStore):
             print(f"Error loading job {job_id} from Azure Storage: {e}")
             return None
 
+    def get_many(self, job_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several jobs, downloading their blobs concurrently"""
+        wanted = list(job_ids)
+        with ThreadPoolExecutor(max_workers=GET_MANY_WORKERS) as executor:
+            loaded = executor.map(self.get_job, wanted)
+            return {
+                job_id: job
+                for job_id, job in zip(wanted, loaded, strict=True)
+                if job is not None
+            }
+
     def list_jobs(self) -> list[str]:
         """List all job IDs"""
         container_client = self.blob_service_client.get_container_client(
@@ -268,6 +291,50 @@ class AzureBlobJobStore(JobStore):
             print(f"Error listing jobs from Azure Storage: {e}")
             return []
 
+    def iter_job_summaries(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (job_id, summary) pairs from blob metadata, without downloads"""
+        container_client = self.blob_service_client.get_container_client(
+            self.container_name
+        )
+
+        try:
+            blobs = container_client.list_blobs(
+                name_starts_with="jobs/", include=["metadata"]
+            )
+            for blob in blobs:
+                if not blob.name.endswith(".json"):
+                    continue
+                job_id = blob.name[5:-5]  # Remove "jobs/" prefix and ".json" suffix
+                metadata = blob.metadata or {}
+                summary = {
+                    "status": metadata.get("status"),
+                    "created_at": self._metadata_datetime(metadata.get("created_at")),
+                    "completed_at": self._metadata_datetime(
+                        metadata.get("completed_at")
+                    ),
+                }
+                yield job_id, summary
+        except Exception as e:
+            print(f"Error listing job summaries from Azure Storage: {e}")
+
+    def load_stored_jobs(
+        self, statuses: Container[str]
+    ) -> Iterator[tuple[str, dict[str, Any], dict[str, Any] | None]]:
+        """Yield (job_id, summary, job) triples, downloading only requested jobs"""
+        summaries = list(self.iter_job_summaries())
+        loaded = self.get_many(
+            job_id for job_id, summary in summaries if summary.get("status") in statuses
+        )
+        for job_id, summary in summaries:
+            yield job_id, summary, loaded.get(job_id)
+
+    def _metadata_datetime(self, value: str | None) -> datetime | None:
+        """Parse a datetime from blob metadata, tolerating older formats"""
+        try:
+            return self._deserialize_datetime(value)
+        except ValueError:
+            return None
+
     def delete_job(self, job_id: str) -> None:
         """Delete a job from Azure Blob Storage"""
         blob_name = self._get_blob_name(job_id)
@@ -285,8 +352,6 @@ class AzureBlobJobStore(JobStore):
 
     def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         """Remove jobs older than specified hours"""
-        from datetime import timedelta
-
         cutoff = datetime.now(UTC) - timedelta(hours=max_age_hours)
         deleted_count = 0
 
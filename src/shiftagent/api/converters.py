@@ -2,11 +2,18 @@
 Converters between API schemas and domain models
 """
 
+from collections.abc import Callable, Iterator
+from itertools import islice
 from typing import Any
 
+import orjson
+
 from ..core.models import Employee, Shift, ShiftSchedule
 from .schemas import EmployeeRequest, ShiftScheduleRequest
 
+# Number of employees or shifts encoded per streamed chunk
+STREAM_CHUNK_SIZE = 1000
+
 
 def convert_request_to_domain(request: ShiftScheduleRequest) -> ShiftSchedule:
     """Convert API request to domain objects"""
@@ -15,7 +22,7 @@ def convert_request_to_domain(request: ShiftScheduleRequest) -> ShiftSchedule:
         Employee(
             id=emp.id,
             name=emp.name,
-            skills=set(emp.skills),
+            skills=frozenset(emp.skills),
             preferred_days_off=set(emp.preferred_days_off),
             preferred_work_days=set(emp.preferred_work_days),
             unavailable_dates=set(emp.unavailable_dates),
@@ -29,7 +36,7 @@ def convert_request_to_domain(request: ShiftScheduleRequest) -> ShiftSchedule:
             id=shift.id,
             start_time=shift.start_time,
             end_time=shift.end_time,
-            required_skills=set(shift.required_skills),
+            required_skills=frozenset(shift.required_skills),
             location=shift.location,
             priority=shift.priority,
         )
@@ -39,54 +46,98 @@ def convert_request_to_domain(request: ShiftScheduleRequest) -> ShiftSchedule:
     return ShiftSchedule(employees=employees, shifts=shifts)
 
 
+def _employee_to_response(emp: Employee) -> dict[str, Any]:
+    """Convert an employee to its API response form"""
+    return {
+        "id": emp.id,
+        "name": emp.name,
+        "skills": list(emp.skills),
+        "preferred_days_off": list(emp.preferred_days_off),
+        "preferred_work_days": list(emp.preferred_work_days),
+        "unavailable_dates": [date.isoformat() for date in emp.unavailable_dates],
+    }
+
+
+def _shift_to_response(shift: Shift) -> dict[str, Any]:
+    """Convert a shift to its API response form"""
+    return {
+        "id": shift.id,
+        "start_time": shift.start_time.isoformat(),
+        "end_time": shift.end_time.isoformat(),
+        "required_skills": list(shift.required_skills),
+        "location": shift.location,
+        "priority": shift.priority,
+        "employee": (
+            {"id": shift.employee.id, "name": shift.employee.name}
+            if shift.employee
+            else None
+        ),
+        "pinned": shift.pinned,
+    }
+
+
+def _statistics(
+    schedule: ShiftSchedule, assigned_shifts: int | None = None
+) -> dict[str, int]:
+    """Summarize a schedule's employee and shift counts"""
+    if assigned_shifts is None:
+        assigned_shifts, unassigned_shifts = schedule.get_assignment_counts()
+    else:
+        unassigned_shifts = schedule.get_shift_count() - assigned_shifts
+    return {
+        "total_employees": schedule.get_employee_count(),
+        "total_shifts": schedule.get_shift_count(),
+        "assigned_shifts": assigned_shifts,
+        "unassigned_shifts": unassigned_shifts,
+    }
+
+
 def convert_domain_to_response(schedule: ShiftSchedule) -> dict[str, Any]:
     """Convert domain objects to API response"""
     return {
-        "employees": [
-            {
-                "id": emp.id,
-                "name": emp.name,
-                "skills": list(emp.skills),
-                "preferred_days_off": list(emp.preferred_days_off),
-                "preferred_work_days": list(emp.preferred_work_days),
-                "unavailable_dates": [
-                    date.isoformat() for date in emp.unavailable_dates
-                ],
-            }
-            for emp in schedule.employees
-        ],
-        "shifts": [
-            {
-                "id": shift.id,
-                "start_time": shift.start_time.isoformat(),
-                "end_time": shift.end_time.isoformat(),
-                "required_skills": list(shift.required_skills),
-                "location": shift.location,
-                "priority": shift.priority,
-                "employee": (
-                    {"id": shift.employee.id, "name": shift.employee.name}
-                    if shift.employee
-                    else None
-                ),
-                "pinned": shift.pinned,
-            }
-            for shift in schedule.shifts
-        ],
-        "statistics": {
-            "total_employees": schedule.get_employee_count(),
-            "total_shifts": schedule.get_shift_count(),
-            "assigned_shifts": schedule.get_assigned_shift_count(),
-            "unassigned_shifts": schedule.get_unassigned_shift_count(),
-        },
+        "employees": [_employee_to_response(emp) for emp in schedule.employees],
+        "shifts": [_shift_to_response(shift) for shift in schedule.shifts],
+        "statistics": _statistics(schedule),
     }
 
 
+def _iter_json_array(
+    items: list[Any], convert: Callable[[Any], dict[str, Any]]
+) -> Iterator[bytes]:
+    """Encode a list as a JSON array, a chunk of items at a time"""
+    yield b"["
+    iterator = iter(items)
+    separator = b""
+    while chunk := list(islice(iterator, STREAM_CHUNK_SIZE)):
+        # Encode the chunk as an array and strip its brackets
+        yield separator + orjson.dumps([convert(item) for item in chunk])[1:-1]
+        separator = b","
+    yield b"]"
+
+
+def iter_domain_response_json(
+    schedule: ShiftSchedule,
+    assigned_shifts: int | None = None,
+    extra: dict[str, Any] | None = None,
+) -> Iterator[bytes]:
+    """Stream the API response for a schedule as encoded JSON chunks"""
+    yield b'{"employees":'
+    yield from _iter_json_array(schedule.employees, _employee_to_response)
+    yield b',"shifts":'
+    yield from _iter_json_array(schedule.shifts, _shift_to_response)
+    yield b',"statistics":' + orjson.dumps(_statistics(schedule, assigned_shifts))
+    if extra:
+        # Splice the extra fields in without their enclosing braces
+        yield b"," + orjson.dumps(extra)[1:-1]
+    yield b"}"
+
+
 def convert_employee_request_to_domain(request: EmployeeRequest) -> Employee:
     """Convert employee API request to domain object"""
     return Employee(
         id=request.id,
         name=request.name,
-        skills=set(request.skills),
+        skills=frozenset(request.skills),
         preferred_days_off=set(request.preferred_days_off),
         preferred_work_days=set(request.preferred_work_days),
         unavailable_dates=set(request.unavailable_dates),
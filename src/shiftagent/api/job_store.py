@@ -4,6 +4,7 @@ Job persistence layer for storing optimization jobs
 
 import json
 import os
+from collections.abc import Container, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Protocol
@@ -28,6 +29,16 @@ class JobStore(Protocol):
         """List all job IDs"""
         ...
 
+    def iter_job_summaries(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (job_id, summary) pairs with status and timestamps only"""
+        ...
+
+    def load_stored_jobs(
+        self, statuses: Container[str]
+    ) -> Iterator[tuple[str, dict[str, Any], dict[str, Any] | None]]:
+        """Yield (job_id, summary, job) triples, loading jobs in the given statuses"""
+        ...
+
     def delete_job(self, job_id: str) -> None:
         """Delete a job from storage"""
         ...
@@ -102,6 +113,8 @@ class FileSystemJobStore:
             "status": job_data["status"],
             "created_at": self._serialize_datetime(job_data.get("created_at")),
             "completed_at": self._serialize_datetime(job_data.get("completed_at")),
+            # Kept so a reloaded job's solution ETag matches its latest change
+            "updated_at": self._serialize_datetime(job_data.get("updated_at")),
             "error": job_data.get("error"),
             # Don't serialize solver reference or other non-serializable objects
         }
@@ -127,7 +140,7 @@ class FileSystemJobStore:
         return Employee(
             id=emp_data["id"],
             name=emp_data["name"],
-            skills=set(emp_data["skills"]),
+            skills=frozenset(emp_data["skills"]),
             preferred_days_off=set(emp_data.get("preferred_days_off", [])),
             preferred_work_days=set(emp_data.get("preferred_work_days", [])),
             unavailable_dates={
@@ -154,7 +167,7 @@ class FileSystemJobStore:
             id=shift_data["id"],
             start_time=start_time,
             end_time=end_time,
-            required_skills=set(shift_data["required_skills"]),
+            required_skills=frozenset(shift_data["required_skills"]),
             location=shift_data["location"],
             priority=shift_data["priority"],
             pinned=shift_data.get("pinned", False),
@@ -186,6 +199,30 @@ class FileSystemJobStore:
             pass
         return schedule
 
+    def _read_job_file(self, job_path: Path) -> dict[str, Any]:
+        """Read the raw JSON data of a job file"""
+        with open(job_path, encoding="utf-8") as f:
+            data: dict[str, Any] = json.load(f)
+        return data
+
+    def _job_from_data(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert raw job data back to datetimes and domain objects"""
+        # Convert datetime strings back to datetime objects
+        if data.get("created_at"):
+            data["created_at"] = self._deserialize_datetime(data["created_at"])
+        if data.get("completed_at"):
+            data["completed_at"] = self._deserialize_datetime(data["completed_at"])
+        if data.get("updated_at"):
+            data["updated_at"] = self._deserialize_datetime(data["updated_at"])
+
+        # Convert problem and solution back to domain objects
+        if data.get("problem"):
+            data["problem"] = self._deserialize_schedule(data["problem"])
+        if data.get("solution"):
+            data["solution"] = self._deserialize_schedule(data["solution"])
+
+        return data
+
     def get_job(self, job_id: str) -> dict[str, Any] | None:
         """Retrieve job data from file"""
         job_path = self._get_job_path(job_id)
@@ -193,22 +230,7 @@ class FileSystemJobStore:
             return None
 
         try:
-            with open(job_path, encoding="utf-8") as f:
-                data: dict[str, Any] = json.load(f)
-
-            # Convert datetime strings back to datetime objects
-            if data.get("created_at"):
-                data["created_at"] = self._deserialize_datetime(data["created_at"])
-            if data.get("completed_at"):
-                data["completed_at"] = self._deserialize_datetime(data["completed_at"])
-
-            # Convert problem and solution back to domain objects
-            if data.get("problem"):
-                data["problem"] = self._deserialize_schedule(data["problem"])
-            if data.get("solution"):
-                data["solution"] = self._deserialize_schedule(data["solution"])
-
-            return data
+            return self._job_from_data(self._read_job_file(job_path))
         except Exception as e:
             print(f"Error loading job {job_id}: {e}")
             return None
@@ -218,6 +240,34 @@ class FileSystemJobStore:
         job_files = self.storage_dir.glob("*.json")
         return [f.stem for f in job_files]
 
+    def iter_job_summaries(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (job_id, summary) pairs without rebuilding problems or solutions"""
+        for job_id, summary, _ in self.load_stored_jobs(()):
+            yield job_id, summary
+
+    def load_stored_jobs(
+        self, statuses: Container[str]
+    ) -> Iterator[tuple[str, dict[str, Any], dict[str, Any] | None]]:
+        """Yield (job_id, summary, job) triples, reading each file only once"""
+        for job_path in self.storage_dir.glob("*.json"):
+            try:
+                data = self._read_job_file(job_path)
+                summary = {
+                    "status": data.get("status"),
+                    "created_at": self._deserialize_datetime(data.get("created_at")),
+                    "completed_at": self._deserialize_datetime(
+                        data.get("completed_at")
+                    ),
+                }
+                # Only rebuild problems and solutions for the requested statuses
+                job = (
+                    self._job_from_data(data) if summary["status"] in statuses else None
+                )
+            except Exception as e:
+                print(f"Error loading job {job_path.stem}: {e}")
+                continue
+            yield job_path.stem, summary, job
+
     def delete_job(self, job_id: str) -> None:
         """Delete a job file"""
         job_path = self._get_job_path(job_id)
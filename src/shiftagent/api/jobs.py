@@ -2,42 +2,572 @@
 Job management for asynchronous optimization
 """
 
+import asyncio
+import bisect
+import copy
+import functools
+import hashlib
 import logging
+import os
+import queue
 import threading
-from datetime import datetime
-from typing import Any
-
+import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, TypeVar
+
+from ..core.models.employee import Employee
 from ..core.models.schedule import ShiftSchedule
+from ..core.models.shift import Shift
 from .job_store import job_store
-from .solver import SOLVER_LOG_LEVEL, SOLVER_TIMEOUT_SECONDS, solver_factory
+from .solver import (
+    SOLVER_LOG_LEVEL,
+    SOLVER_TIMEOUT_SECONDS,
+    pooled_solver,
+    solver_factory,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Job management dictionary
+# Job management dictionary. Each job dict is treated as immutable once
+# published: writers swap in an updated copy under the job's stripe lock, so
+# readers can take a reference without locking and never see a half-applied update.
 jobs: dict[str, dict[str, Any]] = {}
+# Guards inserting and removing jobs; updates to a single job take its stripe lock
 job_lock = threading.Lock()
 
+# Per-job locks, striped so operations on unrelated jobs do not contend
+JOB_LOCK_STRIPES = 16
+_stripe_locks = [threading.Lock() for _ in range(JOB_LOCK_STRIPES)]
+
+# Bounded pool running the background optimizations started by solve requests
+SOLVE_WORKERS = int(os.getenv("SOLVE_WORKERS", "4"))
+SOLVE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=SOLVE_WORKERS, thread_name_prefix="solve-async"
+)
+
+# Finished jobs are evicted from memory once idle this long, or least recently
+# used first while more than MAX_JOBS are held; persisted jobs reload on demand
+MAX_JOBS = int(os.getenv("MAX_JOBS", "1000"))
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", "3600"))
+JOB_REAP_INTERVAL_SECONDS = int(os.getenv("JOB_REAP_INTERVAL_SECONDS", "60"))
+_EVICTABLE_STATUSES = frozenset(("SOLVING_COMPLETED", "SOLVING_FAILED"))
+
+# Monotonic time each in-memory job was last read or written
+_last_access: dict[str, float] = {}
+
+# Job listing index: (created_at, job_id, summary) kept sorted oldest first, and
+# covering persisted jobs that are not loaded into memory as well
+_summaries: list[tuple[datetime, str, dict[str, Any]]] = []
+_summary_keys: dict[str, tuple[datetime, str]] = {}
+_summary_lock = threading.Lock()
+
+# Statuses of jobs whose optimization is queued or running
+ACTIVE_STATUSES = frozenset(("SOLVING_ACTIVE", "SOLVING_SCHEDULED"))
+
+# Events of requests waiting on a job's status, with the event loop each belongs
+# to; set from whichever thread changes the status
+_status_waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+_waiters_lock = threading.Lock()
+
+# Job fields that appear in the listing summary
+_SUMMARY_FIELDS = frozenset(("status", "created_at", "completed_at"))
+
+# Jobs whose store writes are deferred on the current thread, mapped to a dirty flag
+_deferred_syncs = threading.local()
+# Jobs with deferred writes on any thread, counted per operation and guarded by
+# _pending_lock, so eviction can tell a job still has unsaved changes
+_deferred_jobs: Counter[str] = Counter()
+
+# Jobs waiting to be written to persistent storage. A single writer thread drains
+# the queue, so repeated updates to a job collapse into one write of its latest state;
+# None tells the writer to stop
+_pending_syncs: set[str] = set()
+_pending_lock = threading.Lock()
+_sync_queue: queue.Queue[str | None] = queue.Queue()
+_writer_thread: threading.Thread | None = None
+# Held while writing to or deleting from the store, so a write cannot land after
+# the job's deletion
+_store_write_lock = threading.Lock()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _lock_for(job_id: str) -> threading.Lock:
+    """Return the stripe lock guarding updates to a job"""
+    return _stripe_locks[hash(job_id) % JOB_LOCK_STRIPES]
+
+
+def get_job(job_id: str) -> dict[str, Any] | None:
+    """Return a consistent snapshot of a job without taking the lock"""
+    job = jobs.get(job_id)
+    if job is not None:
+        _last_access[job_id] = time.monotonic()
+    return job
+
+
+async def wait_for_job(job_id: str, timeout: float) -> dict[str, Any] | None:
+    """Wait until a job is no longer queued or solving, or the timeout passes"""
+    loop = asyncio.get_running_loop()
+    event = asyncio.Event()
+    waiter = (loop, event)
+    with _waiters_lock:
+        _status_waiters.setdefault(job_id, []).append(waiter)
+
+    deadline = loop.time() + timeout
+    try:
+        while True:
+            # Cleared before checking, so a change made after the check still
+            # wakes the wait below
+            event.clear()
+            job = get_job(job_id)
+            if job is None or job.get("status") not in ACTIVE_STATUSES:
+                return job
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return job
+            try:
+                await asyncio.wait_for(event.wait(), remaining)
+            except TimeoutError:
+                pass
+    finally:
+        with _waiters_lock:
+            waiters = _status_waiters.get(job_id, [])
+            waiters.remove(waiter)
+            if not waiters:
+                _status_waiters.pop(job_id, None)
+
+
+def _notify_status_waiters(job_id: str) -> None:
+    """Wake the requests waiting on a job's status"""
+    with _waiters_lock:
+        waiters = list(_status_waiters.get(job_id, ()))
+    for loop, event in waiters:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # The waiter's event loop has already closed
+            pass
+
+
+def load_job(job_id: str) -> dict[str, Any] | None:
+    """Return a job, loading it back from persistent storage if not in memory"""
+    job = get_job(job_id)
+    if job is None and job_store:
+        stored_job = job_store.get_job(job_id)
+        if stored_job:
+            with job_lock:
+                # Another request may have loaded or updated it meanwhile
+                job = get_job(job_id)
+                if job is None:
+                    register_job(job_id, stored_job)
+                    job = stored_job
+    return job
+
+
+def get_jobs_snapshot() -> dict[str, dict[str, Any]]:
+    """Return a point-in-time copy of all jobs without taking the lock"""
+    return jobs.copy()
+
+
+def index_job(job_id: str, job: dict[str, Any]) -> None:
+    """Add or refresh a job's entry in the listing index"""
+    created_at = job.get("created_at")
+    summary = {
+        "job_id": job_id,
+        "status": job.get("status"),
+        "created_at": created_at,
+        "completed_at": job.get("completed_at"),
+    }
+    key = (created_at or datetime.min, job_id)
+    with _summary_lock:
+        _remove_summary(job_id)
+        bisect.insort(_summaries, (*key, summary))
+        _summary_keys[job_id] = key
+
+
+def unindex_job(job_id: str) -> None:
+    """Drop a job from the listing index"""
+    with _summary_lock:
+        _remove_summary(job_id)
+
+
+def prune_job_index(keep_ids: set[str]) -> None:
+    """Drop listing entries for jobs that no longer exist anywhere"""
+    with _summary_lock:
+        for job_id in [job_id for job_id in _summary_keys if job_id not in keep_ids]:
+            _remove_summary(job_id)
+
+
+def _remove_summary(job_id: str) -> None:
+    """Remove a job's listing entry; the caller must hold _summary_lock"""
+    key = _summary_keys.pop(job_id, None)
+    if key is not None:
+        del _summaries[bisect.bisect_left(_summaries, key)]
+
+
+def job_ids_created_before(cutoff: datetime) -> list[str]:
+    """Return indexed job IDs created before the cutoff, oldest first"""
+    entries = _summaries.copy()
+    end = bisect.bisect_left(entries, (cutoff,))
+    return [job_id for _, job_id, _ in entries[:end]]
+
+
+def list_job_summaries() -> list[dict[str, Any]]:
+    """Return job summaries newest first, without touching storage"""
+    entries = _summaries.copy()
+    return [summary for _, _, summary in reversed(entries)]
+
+
+def register_job(job_id: str, job: dict[str, Any]) -> None:
+    """Publish a new job; the caller must hold job_lock"""
+    jobs[job_id] = job
+    _last_access[job_id] = time.monotonic()
+    index_job(job_id, job)
+
+
+def remove_job(job_id: str) -> dict[str, Any] | None:
+    """Remove a job and return its last snapshot; the caller must hold job_lock"""
+    with _lock_for(job_id):
+        _last_access.pop(job_id, None)
+        return jobs.pop(job_id, None)
+
+
+def evict_idle_jobs() -> int:
+    """Evict finished jobs that are idle or over capacity, return how many"""
+    now = time.monotonic()
+    candidates = sorted(
+        (_last_access.get(job_id, 0.0), job_id)
+        for job_id, job in get_jobs_snapshot().items()
+        if job.get("status") in _EVICTABLE_STATUSES
+    )
+    overflow = len(jobs) - MAX_JOBS
+    evicted = 0
+
+    with job_lock:
+        for last_access, job_id in candidates:
+            if evicted >= overflow and now - last_access < JOB_TTL_SECONDS:
+                break
+            with _lock_for(job_id), _pending_lock:
+                # Skip jobs picked up by an operation since the snapshot, or
+                # whose latest state has not been written to the store yet
+                job = jobs.get(job_id)
+                if job is None or job.get("status") not in _EVICTABLE_STATUSES:
+                    continue
+                if job_id in _pending_syncs or job_id in _deferred_jobs:
+                    continue
+                del jobs[job_id]
+                _last_access.pop(job_id, None)
+            if not job_store:
+                # Nothing to reload it from, so it is gone for good
+                unindex_job(job_id)
+            evicted += 1
+
+    if evicted:
+        logger.info(f"Evicted {evicted} idle jobs from memory")
+    return evicted
+
+
+def _update_job(job_id: str, **changes: Any) -> dict[str, Any]:
+    """Publish a copy of a job with changes applied; the caller holds its stripe lock"""
+    job = {**jobs[job_id], **changes}
+    jobs[job_id] = job
+    _last_access[job_id] = time.monotonic()
+    if not _SUMMARY_FIELDS.isdisjoint(changes):
+        index_job(job_id, job)
+    if "status" in changes:
+        _notify_status_waiters(job_id)
+    return job
+
+
+def assigned_shift_count(job: dict[str, Any]) -> int:
+    """Return the assigned shift count of a completed job's solution"""
+    count: int | None = job.get("assigned_count")
+    if count is None:
+        # Jobs loaded from storage do not carry the cached count
+        count = job["solution"].get_assigned_shift_count()
+    return count
+
+
+def _solution_indexes(solution: ShiftSchedule) -> dict[str, Any]:
+    """Build the by-ID lookups stored alongside a published solution"""
+    return {
+        "shift_index": {shift.id: shift for shift in solution.shifts},
+        "employee_index": {emp.id: emp for emp in solution.employees},
+    }
+
+
+def find_shift(job: dict[str, Any], shift_id: str) -> Shift | None:
+    """Look up a shift in a completed job's solution by ID"""
+    index: dict[str, Shift] | None = job.get("shift_index")
+    if index is None:
+        # Jobs loaded from storage do not carry the index
+        return next((s for s in job["solution"].shifts if s.id == shift_id), None)
+    return index.get(shift_id)
+
+
+def find_employee(job: dict[str, Any], employee_id: str) -> Employee | None:
+    """Look up an employee in a completed job's solution by ID"""
+    index: dict[str, Employee] | None = job.get("employee_index")
+    if index is None:
+        # Jobs loaded from storage do not carry the index
+        return next((e for e in job["solution"].employees if e.id == employee_id), None)
+    return index.get(employee_id)
+
+
+def _solution_etag(job_id: str, version: datetime | None) -> str:
+    """Build the weak entity tag for one version of a job's solution"""
+    digest = hashlib.sha256(f"{job_id}:{version}".encode()).hexdigest()[:16]
+    # Weak, since GZipMiddleware may send different bytes for the same version
+    return f'W/"{digest}"'
+
+
+def solution_etag(job_id: str, job: dict[str, Any]) -> str:
+    """Get the entity tag identifying a completed job's current solution"""
+    etag: str | None = job.get("etag")
+    if etag is None:
+        # Jobs loaded from storage do not carry the tag
+        etag = _solution_etag(job_id, job.get("updated_at") or job.get("completed_at"))
+    return etag
+
+
+def _publish_solution(
+    job_id: str,
+    solution: ShiftSchedule,
+    now: datetime,
+    history_key: str,
+    record: dict[str, Any],
+) -> dict[str, Any]:
+    """Publish a re-solved schedule and append its record to the job history"""
+    return _update_job(
+        job_id,
+        status="SOLVING_COMPLETED",
+        solution=solution,
+        updated_at=now,
+        etag=_solution_etag(job_id, now),
+        final_score=str(solution.score),
+        was_feasible=_is_feasible(solution),
+        assigned_count=solution.get_assigned_shift_count(),
+        **_solution_indexes(solution),
+        **{history_key: [*jobs[job_id].get(history_key, []), record]},
+    )
+
 
 def _sync_job_to_store(job_id: str):
-    """Sync job data to persistent storage if available"""
+    """Queue job data for writing to persistent storage if available"""
+    pending: dict[str, bool] | None = getattr(_deferred_syncs, "jobs", None)
+    if pending is not None and job_id in pending:
+        pending[job_id] = True
+        return
     if job_store and job_id in jobs:
+        with _pending_lock:
+            if job_id in _pending_syncs:
+                # The queued write will pick up this change too
+                return
+            _pending_syncs.add(job_id)
+        _sync_queue.put(job_id)
+
+
+def _write_queued_job(job_id: str) -> None:
+    """Write a queued job's latest state to persistent storage"""
+    try:
+        with _store_write_lock:
+            with _pending_lock:
+                _pending_syncs.discard(job_id)
+                job = jobs.get(job_id)
+            if job is not None and job_store:
+                job_store.save_job(job_id, job)
+    except Exception as e:
+        print(f"Error saving job {job_id} to storage: {e}")
+
+
+def _store_writer() -> None:
+    """Write queued jobs to persistent storage, one at a time, until stopped"""
+    while True:
+        job_id = _sync_queue.get()
+        try:
+            if job_id is None:
+                return
+            _write_queued_job(job_id)
+        finally:
+            _sync_queue.task_done()
+
+
+def start_store_writer() -> None:
+    """Start the thread writing queued jobs to persistent storage"""
+    global _writer_thread
+    if _writer_thread is None or not _writer_thread.is_alive():
+        _writer_thread = threading.Thread(
+            target=_store_writer, name="job-store-writer", daemon=True
+        )
+        _writer_thread.start()
+
+
+def stop_store_writer() -> None:
+    """Write every queued job, then stop the writer thread"""
+    global _writer_thread
+    thread = _writer_thread
+    if thread is None or not thread.is_alive():
+        flush_job_syncs()
+        return
+    # Queued after the pending jobs, so the writer saves them all first
+    _sync_queue.put(None)
+    thread.join()
+    _writer_thread = None
+
+
+def sync_job(job_id: str) -> None:
+    """Queue the job's current state for writing to persistent storage"""
+    _sync_job_to_store(job_id)
+
+
+def flush_job_syncs() -> None:
+    """Block until every queued job write has reached persistent storage"""
+    if _writer_thread is not None and _writer_thread.is_alive():
+        _sync_queue.join()
+        return
+    # Without a writer thread, drain the queue on the calling thread
+    while True:
         try:
-            job_store.save_job(job_id, jobs[job_id])
-        except Exception as e:
-            print(f"Error saving job {job_id} to storage: {e}")
+            job_id = _sync_queue.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            if job_id is not None:
+                _write_queued_job(job_id)
+        finally:
+            _sync_queue.task_done()
+
+
+def delete_stored_job(job_id: str) -> None:
+    """Delete a removed job from persistent storage"""
+    if job_store:
+        with _store_write_lock:
+            job_store.delete_job(job_id)
+
+
+def _buffered_sync(func: F) -> F:
+    """Collapse the store syncs of a job operation into one write on return"""
+
+    @functools.wraps(func)
+    def wrapper(job_id: str, *args: Any, **kwargs: Any) -> Any:
+        pending: dict[str, bool] = _deferred_syncs.__dict__.setdefault("jobs", {})
+        if job_id in pending:
+            # An enclosing operation on the same job owns the flush
+            return func(job_id, *args, **kwargs)
+
+        pending[job_id] = False
+        with _pending_lock:
+            _deferred_jobs[job_id] += 1
+        try:
+            return func(job_id, *args, **kwargs)
+        finally:
+            if pending.pop(job_id):
+                _sync_job_to_store(job_id)
+            # Only release the job once its write is queued as a pending sync
+            with _pending_lock:
+                _deferred_jobs[job_id] -= 1
+                if not _deferred_jobs[job_id]:
+                    del _deferred_jobs[job_id]
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _working_copy(solution: ShiftSchedule) -> ShiftSchedule:
+    """Copy a solution so it can be modified without touching the original"""
+    working_solution = copy.copy(solution)
+    working_solution.employees = list(solution.employees)
+    working_solution.shifts = [copy.copy(shift) for shift in solution.shifts]
+    return working_solution
+
+
+def _is_feasible(solution: ShiftSchedule) -> bool:
+    """Check whether a solved schedule breaks no hard constraints"""
+    return solution.score is not None and solution.score.hard_score == 0
+
+
+def _pin_valid_assignments(
+    job_id: str,
+    solution: ShiftSchedule,
+    exclude_shift_id: str | None = None,
+    assume_valid: bool = False,
+) -> tuple[set[str], int]:
+    """Pin assignments without hard constraint violations, return the pinned IDs"""
+    pinned_ids: set[str] = set()
+    if assume_valid:
+        # A feasible solution has no violations to leave unpinned
+        for shift in solution.shifts:
+            if (
+                shift.employee is not None
+                and not shift.pinned
+                and shift.id != exclude_shift_id
+            ):
+                shift.pin()
+                pinned_ids.add(shift.id)
+        return pinned_ids, 0
+
+    # Memoize skill checks per (employee, required skills) pair and build each
+    # employee's unavailable dates once instead of rescanning them for every shift
+    skills_cache: dict[tuple[str, frozenset[str]], bool] = {}
+    unavailable_dates: dict[str, frozenset[date]] = {}
+    log_violations = logger.isEnabledFor(logging.INFO)
+    unpinned_violations = 0
+
+    for shift in solution.shifts:
+        current_emp = shift.employee
+        if current_emp is None or shift.pinned or shift.id == exclude_shift_id:
+            continue
+
+        skills_key = (current_emp.id, shift.required_skills)
+        has_skills = skills_cache.get(skills_key)
+        if has_skills is None:
+            has_skills = current_emp.has_required_skills(shift.required_skills)
+            skills_cache[skills_key] = has_skills
+
+        emp_unavailable = unavailable_dates.get(current_emp.id)
+        if emp_unavailable is None:
+            emp_unavailable = frozenset(
+                d.date() for d in current_emp.unavailable_dates or () if d is not None
+            )
+            unavailable_dates[current_emp.id] = emp_unavailable
+
+        # Leave hard constraint violations unpinned so the solver can fix them
+        if not has_skills:
+            unpinned_violations += 1
+            if log_violations:
+                logger.info(
+                    "[Job %s] Not pinning shift %s due to skill mismatch",
+                    job_id,
+                    shift.id,
+                )
+        elif shift.start_time.date() in emp_unavailable:
+            unpinned_violations += 1
+            if log_violations:
+                logger.info(
+                    "[Job %s] Not pinning shift %s due to unavailability",
+                    job_id,
+                    shift.id,
+                )
+        else:
+            shift.pin()
+            pinned_ids.add(shift.id)
+
+    return pinned_ids, unpinned_violations
 
 
 def solve_problem_async(job_id: str, problem: ShiftSchedule):
     """Execute shift optimization asynchronously"""
     try:
-        with job_lock:
-            jobs[job_id]["status"] = "SOLVING_ACTIVE"
-            _sync_job_to_store(job_id)
+        with _lock_for(job_id):
+            _update_job(job_id, status="SOLVING_ACTIVE")
 
         solver = solver_factory.build_solver()
 
-        start_time = datetime.now()
+        # Monotonic clock for the elapsed time, wall clock for the job record
+        started = time.monotonic()
         logger.info(
             f"[Job {job_id}] Starting optimization with {len(problem.shifts)} shifts "
             f"and {len(problem.employees)} employees (timeout: {SOLVER_TIMEOUT_SECONDS}s)"
@@ -53,15 +583,17 @@ def solve_problem_async(job_id: str, problem: ShiftSchedule):
             )
 
         # Store solver reference for continuous planning
-        with job_lock:
-            jobs[job_id]["solver"] = solver
-            jobs[job_id]["status"] = "SOLVING_SCHEDULED"
-            jobs[job_id]["start_time"] = start_time
-            _sync_job_to_store(job_id)
+        with _lock_for(job_id):
+            _update_job(
+                job_id,
+                solver=solver,
+                status="SOLVING_SCHEDULED",
+                start_time=datetime.now(),
+            )
 
         solution = solver.solve(problem)
 
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = time.monotonic() - started
 
         # Log final results
         assigned_count = sum(
@@ -82,51 +614,79 @@ def solve_problem_async(job_id: str, problem: ShiftSchedule):
                 f"Soft: {solution.score.soft_score}"
             )
 
-        with job_lock:
-            jobs[job_id]["status"] = "SOLVING_COMPLETED"
-            jobs[job_id]["solution"] = solution
-            jobs[job_id]["completed_at"] = datetime.now()
-            jobs[job_id]["final_score"] = str(solution.score)
-            # Remove solver reference after completion
-            if "solver" in jobs[job_id]:
-                del jobs[job_id]["solver"]
-            _sync_job_to_store(job_id)
+        with _lock_for(job_id):
+            # Publish the result and drop the solver reference in one update
+            completed_at = datetime.now()
+            _update_job(
+                job_id,
+                status="SOLVING_COMPLETED",
+                solution=solution,
+                completed_at=completed_at,
+                etag=_solution_etag(job_id, completed_at),
+                final_score=str(solution.score),
+                was_feasible=_is_feasible(solution),
+                assigned_count=assigned_count,
+                solver=None,
+                **_solution_indexes(solution),
+            )
 
     except Exception as e:
         logger.error(f"[Job {job_id}] Optimization failed: {str(e)}")
-        with job_lock:
-            jobs[job_id]["status"] = "SOLVING_FAILED"
-            jobs[job_id]["error"] = str(e)
+        with _lock_for(job_id):
             # Remove solver reference on failure
-            if "solver" in jobs[job_id]:
-                del jobs[job_id]["solver"]
+            _update_job(job_id, status="SOLVING_FAILED", error=str(e), solver=None)
+
+
+def submit_solve(job_id: str, problem: ShiftSchedule) -> Future[None]:
+    """Queue optimization of a registered job on the bounded solve executor"""
+    future = SOLVE_EXECUTOR.submit(solve_problem_async, job_id, problem)
+    with _lock_for(job_id):
+        if job_id in jobs:
+            _update_job(job_id, future=future)
+    future.add_done_callback(functools.partial(_on_solve_done, job_id))
+    return future
+
+
+def _on_solve_done(job_id: str, future: Future[None]) -> None:
+    """Persist the final job state once its background optimization ends"""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error(f"[Job {job_id}] Optimization crashed: {exc}")
+    with _lock_for(job_id):
+        if job_id in jobs:
+            _update_job(job_id, future=None)
             _sync_job_to_store(job_id)
 
 
-def add_employee_to_completed_job(job_id: str, new_employee) -> bool:
+@_buffered_sync
+def add_employee_to_completed_job(job_id: str, new_employee) -> tuple[bool, str | None]:
     """Add employee to completed job using Problem Fact Changes"""
     try:
-        with job_lock:
+        with _lock_for(job_id):
             if job_id not in jobs:
                 logger.error(f"Job {job_id} not found")
-                return False
+                return False, f"Job {job_id} not found"
 
             job = jobs[job_id]
 
             # Only allow adding to completed jobs
             if job["status"] != "SOLVING_COMPLETED":
                 logger.error(f"Job {job_id} status is {job['status']}, not completed")
-                return False
+                return False, f"Job {job_id} is not completed"
 
             if "solution" not in job:
                 logger.error(f"Job {job_id} has no solution")
-                return False
+                return False, f"Job {job_id} has no solution"
 
-            # Get the current solution
-            current_solution = job["solution"]
+            # Work on a copy so the stored solution stays intact until the
+            # updated one is written back
+            current_solution = _working_copy(job["solution"])
+            was_feasible = job.get("was_feasible", False)
 
             # Mark job as being modified
-            jobs[job_id]["status"] = "ADDING_EMPLOYEE"
+            _update_job(job_id, status="ADDING_EMPLOYEE")
             _sync_job_to_store(job_id)
 
         # Pin all existing assignments to preserve them during re-optimization
@@ -135,38 +695,12 @@ def add_employee_to_completed_job(job_id: str, new_employee) -> bool:
         )
 
         # Pin only valid assignments - allow constraint violations to be fixed
-        pinned_count = 0
-        unpinned_violations = 0
-
-        for shift in current_solution.shifts:
-            if shift.employee is not None and not shift.pinned:
-                # Check if current assignment has constraint violations
-                current_emp = shift.employee
-                has_violation = False
-
-                # Check for hard constraint violations that should be fixed
-                if not current_emp.has_required_skills(shift.required_skills):
-                    has_violation = True
-                    unpinned_violations += 1
-                    logger.info(
-                        f"[Job {job_id}] Not pinning shift {shift.id} due to skill mismatch. "
-                        f"Employee {current_emp.name} has skills {current_emp.skills}, "
-                        f"but shift requires {shift.required_skills}"
-                    )
-                elif current_emp.is_unavailable_on_date(shift.start_time):
-                    has_violation = True
-                    unpinned_violations += 1
-                    logger.info(
-                        f"[Job {job_id}] Not pinning shift {shift.id} due to unavailability"
-                    )
-
-                # Only pin assignments without violations
-                if not has_violation:
-                    shift.pin()
-                    pinned_count += 1
+        pinned_ids, unpinned_violations = _pin_valid_assignments(
+            job_id, current_solution, assume_valid=was_feasible
+        )
 
         logger.info(
-            f"[Job {job_id}] Pinned {pinned_count} valid assignments, "
+            f"[Job {job_id}] Pinned {len(pinned_ids)} valid assignments, "
             f"left {unpinned_violations} constraint violations unpinned for fixing"
         )
 
@@ -176,15 +710,14 @@ def add_employee_to_completed_job(job_id: str, new_employee) -> bool:
             f"[Job {job_id}] Added new employee {new_employee.name} with skills: {new_employee.skills}"
         )
 
-        # Use existing solver factory with pinned assignments
-        solver = solver_factory.build_solver()
-
+        # Use a pooled solver with pinned assignments
         logger.info(f"[Job {job_id}] Running solver with pinned assignments...")
-        updated_solution = solver.solve(current_solution)
+        with pooled_solver() as solver:
+            updated_solution = solver.solve(current_solution)
 
-        # Unpin shifts for future modifications
+        # Unpin only the shifts pinned for this solve
         for shift in updated_solution.shifts:
-            if shift.pinned:
+            if shift.id in pinned_ids:
                 shift.pinned = False
 
         # Count changes made
@@ -195,27 +728,23 @@ def add_employee_to_completed_job(job_id: str, new_employee) -> bool:
         )
 
         # Update the job with new solution
-        with job_lock:
-            jobs[job_id]["status"] = "SOLVING_COMPLETED"
-            jobs[job_id]["solution"] = updated_solution
-            jobs[job_id]["updated_at"] = datetime.now()
-            jobs[job_id]["final_score"] = str(updated_solution.score)
-
+        now = datetime.now()
+        with _lock_for(job_id):
             # Track the addition
-            if "employee_additions" not in jobs[job_id]:
-                jobs[job_id]["employee_additions"] = []
-            jobs[job_id]["employee_additions"].append(
+            job = _publish_solution(
+                job_id,
+                updated_solution,
+                now,
+                "employee_additions",
                 {
                     "employee_id": new_employee.id,
                     "employee_name": new_employee.name,
-                    "timestamp": datetime.now(),
-                }
+                    "timestamp": now,
+                },
             )
             _sync_job_to_store(job_id)
 
-        total_assigned = sum(
-            1 for s in updated_solution.shifts if s.employee is not None
-        )
+        total_assigned = job["assigned_count"]
 
         logger.info(
             f"[Job {job_id}] Employee addition completed using pinned optimization. "
@@ -224,39 +753,46 @@ def add_employee_to_completed_job(job_id: str, new_employee) -> bool:
             f"New employee assigned to: {assigned_count} shifts"
         )
 
-        return True
+        return True, None
 
     except Exception as e:
         logger.error(f"[Job {job_id}] Failed to add employee: {str(e)}")
-        with job_lock:
+        with _lock_for(job_id):
             if job_id in jobs:
-                jobs[job_id]["status"] = "SOLVING_FAILED"
-                jobs[job_id]["error"] = f"Employee addition failed: {str(e)}"
+                _update_job(
+                    job_id,
+                    status="SOLVING_FAILED",
+                    error=f"Employee addition failed: {str(e)}",
+                )
                 _sync_job_to_store(job_id)
-        return False
+        return False, f"Employee addition failed: {str(e)}"
 
 
-def update_employee_skills(job_id: str, employee_id: str, new_skills: set[str]) -> bool:
+@_buffered_sync
+def update_employee_skills(
+    job_id: str, employee_id: str, new_skills: set[str]
+) -> tuple[bool, str | None]:
     """Update employee skills and re-optimize only necessary parts"""
     try:
-        with job_lock:
+        with _lock_for(job_id):
             if job_id not in jobs:
                 logger.error(f"Job {job_id} not found")
-                return False
+                return False, f"Job {job_id} not found"
 
             job = jobs[job_id]
 
             # Only allow updating completed jobs
             if job["status"] != "SOLVING_COMPLETED":
                 logger.error(f"Job {job_id} status is {job['status']}, not completed")
-                return False
+                return False, f"Job {job_id} is not completed"
 
             if "solution" not in job:
                 logger.error(f"Job {job_id} has no solution")
-                return False
+                return False, f"Job {job_id} has no solution"
 
-            # Get the current solution
-            current_solution = job["solution"]
+            # Work on a copy so the stored solution stays intact until the
+            # updated one is written back
+            current_solution = _working_copy(job["solution"])
 
             # Find the employee to update
             target_employee = None
@@ -267,10 +803,10 @@ def update_employee_skills(job_id: str, employee_id: str, new_skills: set[str])
 
             if not target_employee:
                 logger.error(f"Employee {employee_id} not found in job {job_id}")
-                return False
+                return False, f"Employee {employee_id} not found"
 
             # Mark job as being modified
-            jobs[job_id]["status"] = "UPDATING_EMPLOYEE_SKILLS"
+            _update_job(job_id, status="UPDATING_EMPLOYEE_SKILLS")
             _sync_job_to_store(job_id)
 
         logger.info(
@@ -278,9 +814,19 @@ def update_employee_skills(job_id: str, employee_id: str, new_skills: set[str])
             f"from {target_employee.skills} to {new_skills}"
         )
 
-        # Update employee skills
-        old_skills = target_employee.skills.copy()
-        target_employee.skills = new_skills
+        # Update skills on a copy of the employee so the stored one keeps its
+        # skills until the re-optimized solution is written back
+        original_employee = target_employee
+        old_skills = original_employee.skills
+        target_employee = copy.copy(original_employee)
+        target_employee.skills = frozenset(new_skills)
+        current_solution.employees = [
+            target_employee if emp is original_employee else emp
+            for emp in current_solution.employees
+        ]
+        for shift in current_solution.shifts:
+            if shift.employee is original_employee:
+                shift.employee = target_employee
         added_skills = new_skills - old_skills
         removed_skills = old_skills - new_skills
 
@@ -290,7 +836,7 @@ def update_employee_skills(job_id: str, employee_id: str, new_skills: set[str])
         )
 
         # Pin assignments that should be preserved - more nuanced approach
-        pinned_count = 0
+        pinned_ids: set[str] = set()
         unpinned_for_improvement = 0
 
         for shift in current_solution.shifts:
@@ -326,22 +872,21 @@ def update_employee_skills(job_id: str, employee_id: str, new_skills: set[str])
 
                 if should_pin:
                     shift.pin()
-                    pinned_count += 1
+                    pinned_ids.add(shift.id)
 
         logger.info(
-            f"[Job {job_id}] Pinned {pinned_count} assignments, "
+            f"[Job {job_id}] Pinned {len(pinned_ids)} assignments, "
             f"left {unpinned_for_improvement} unpinned for potential improvement"
         )
 
         # Use solver with pinned assignments for targeted optimization
-        solver = solver_factory.build_solver()
-
         logger.info(f"[Job {job_id}] Running solver with updated skills...")
-        updated_solution = solver.solve(current_solution)
+        with pooled_solver() as solver:
+            updated_solution = solver.solve(current_solution)
 
-        # Unpin shifts for future modifications
+        # Unpin only the shifts pinned for this solve
         for shift in updated_solution.shifts:
-            if shift.pinned:
+            if shift.id in pinned_ids:
                 shift.pinned = False
 
         # Count changes made
@@ -362,30 +907,26 @@ def update_employee_skills(job_id: str, employee_id: str, new_skills: set[str])
                     )
 
         # Update the job with new solution
-        with job_lock:
-            jobs[job_id]["status"] = "SOLVING_COMPLETED"
-            jobs[job_id]["solution"] = updated_solution
-            jobs[job_id]["updated_at"] = datetime.now()
-            jobs[job_id]["final_score"] = str(updated_solution.score)
-
+        now = datetime.now()
+        with _lock_for(job_id):
             # Track the skill update
-            if "skill_updates" not in jobs[job_id]:
-                jobs[job_id]["skill_updates"] = []
-            jobs[job_id]["skill_updates"].append(
+            job = _publish_solution(
+                job_id,
+                updated_solution,
+                now,
+                "skill_updates",
                 {
                     "employee_id": employee_id,
                     "employee_name": target_employee.name,
                     "old_skills": list(old_skills),
                     "new_skills": list(new_skills),
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                     "changes_made": changes_count,
-                }
+                },
             )
             _sync_job_to_store(job_id)
 
-        total_assigned = sum(
-            1 for s in updated_solution.shifts if s.employee is not None
-        )
+        total_assigned = job["assigned_count"]
 
         logger.info(
             f"[Job {job_id}] Skill update completed. "
@@ -394,18 +935,22 @@ def update_employee_skills(job_id: str, employee_id: str, new_skills: set[str])
             f"Assignment changes made: {changes_count}"
         )
 
-        return True
+        return True, None
 
     except Exception as e:
         logger.error(f"[Job {job_id}] Failed to update employee skills: {str(e)}")
-        with job_lock:
+        with _lock_for(job_id):
             if job_id in jobs:
-                jobs[job_id]["status"] = "SOLVING_FAILED"
-                jobs[job_id]["error"] = f"Skill update failed: {str(e)}"
+                _update_job(
+                    job_id,
+                    status="SOLVING_FAILED",
+                    error=f"Skill update failed: {str(e)}",
+                )
                 _sync_job_to_store(job_id)
-        return False
+        return False, f"Skill update failed: {str(e)}"
 
 
+@_buffered_sync
 def reassign_shift_in_job(
     job_id: str, shift_id: str, new_employee_id: str | None, force: bool = False
 ) -> tuple[bool, list[str]]:
@@ -413,7 +958,7 @@ def reassign_shift_in_job(
     warnings = []
 
     try:
-        with job_lock:
+        with _lock_for(job_id):
             if job_id not in jobs:
                 logger.error(f"Job {job_id} not found")
                 return False, [f"Job {job_id} not found"]
@@ -429,8 +974,10 @@ def reassign_shift_in_job(
                 logger.error(f"Job {job_id} has no solution")
                 return False, [f"Job {job_id} has no solution"]
 
-            # Get the current solution
-            current_solution = job["solution"]
+            # Work on a copy so the stored solution stays intact until the
+            # updated one is written back
+            current_solution = _working_copy(job["solution"])
+            was_feasible = job.get("was_feasible", False)
 
             # Find the shift to reassign
             target_shift = None
@@ -456,7 +1003,7 @@ def reassign_shift_in_job(
                     return False, [f"Employee {new_employee_id} not found"]
 
             # Mark job as being modified
-            jobs[job_id]["status"] = "REASSIGNING_SHIFT"
+            _update_job(job_id, status="REASSIGNING_SHIFT")
             _sync_job_to_store(job_id)
 
         # Perform validation
@@ -465,7 +1012,7 @@ def reassign_shift_in_job(
         if new_employee is not None:
             # Check skill requirements
             if not new_employee.has_required_skills(target_shift.required_skills):
-                missing_skills = target_shift.required_skills - new_employee.skills
+                missing_skills = set(target_shift.required_skills) - new_employee.skills
                 error_msg = f"Employee {new_employee.name} lacks required skills: {missing_skills}"
                 if force:
                     warnings.append(f"WARNING: {error_msg} (forced)")
@@ -502,9 +1049,8 @@ def reassign_shift_in_job(
                 f"Reassignment validation failed: {'; '.join(validation_errors)}"
             )
             logger.error(f"[Job {job_id}] {error_msg}")
-            with job_lock:
-                jobs[job_id]["status"] = "SOLVING_FAILED"
-                jobs[job_id]["error"] = error_msg
+            with _lock_for(job_id):
+                _update_job(job_id, status="SOLVING_FAILED", error=error_msg)
                 _sync_job_to_store(job_id)
             return False, validation_errors
 
@@ -518,51 +1064,37 @@ def reassign_shift_in_job(
         )
 
         # Pin all other assignments to preserve them during re-optimization
-        pinned_count = 0
-        for shift in current_solution.shifts:
-            if shift.id != shift_id and shift.employee is not None and not shift.pinned:
-                # Only pin assignments without violations
-                current_emp = shift.employee
-                has_violation = False
-
-                # Check for hard constraint violations
-                if not current_emp.has_required_skills(shift.required_skills):
-                    has_violation = True
-                elif current_emp.is_unavailable_on_date(shift.start_time):
-                    has_violation = True
-
-                # Only pin valid assignments
-                if not has_violation:
-                    shift.pin()
-                    pinned_count += 1
+        pinned_ids, _ = _pin_valid_assignments(
+            job_id,
+            current_solution,
+            exclude_shift_id=shift_id,
+            assume_valid=was_feasible,
+        )
 
-        logger.info(f"[Job {job_id}] Pinned {pinned_count} other assignments")
+        logger.info(f"[Job {job_id}] Pinned {len(pinned_ids)} other assignments")
 
         # Directly set the new assignment
         target_shift.employee = new_employee
 
         # Use solver to validate and optimize around the new assignment
-        solver = solver_factory.build_solver()
-
         logger.info(f"[Job {job_id}] Running solver to validate reassignment...")
-        updated_solution = solver.solve(current_solution)
+        with pooled_solver() as solver:
+            updated_solution = solver.solve(current_solution)
 
-        # Unpin shifts for future modifications
+        # Unpin only the shifts pinned for this solve
         for shift in updated_solution.shifts:
-            if shift.pinned:
+            if shift.id in pinned_ids:
                 shift.pinned = False
 
         # Update the job with new solution
-        with job_lock:
-            jobs[job_id]["status"] = "SOLVING_COMPLETED"
-            jobs[job_id]["solution"] = updated_solution
-            jobs[job_id]["updated_at"] = datetime.now()
-            jobs[job_id]["final_score"] = str(updated_solution.score)
-
+        now = datetime.now()
+        with _lock_for(job_id):
             # Track the reassignment
-            if "shift_reassignments" not in jobs[job_id]:
-                jobs[job_id]["shift_reassignments"] = []
-            jobs[job_id]["shift_reassignments"].append(
+            job = _publish_solution(
+                job_id,
+                updated_solution,
+                now,
+                "shift_reassignments",
                 {
                     "shift_id": shift_id,
                     "old_employee_id": old_employee.id if old_employee else None,
@@ -571,14 +1103,12 @@ def reassign_shift_in_job(
                     "new_employee_name": new_employee_name,
                     "forced": force,
                     "warnings": warnings,
-                    "timestamp": datetime.now(),
-                }
+                    "timestamp": now,
+                },
             )
             _sync_job_to_store(job_id)
 
-        total_assigned = sum(
-            1 for s in updated_solution.shifts if s.employee is not None
-        )
+        total_assigned = job["assigned_count"]
 
         logger.info(
             f"[Job {job_id}] Shift reassignment completed successfully. "
@@ -590,35 +1120,42 @@ def reassign_shift_in_job(
 
     except Exception as e:
         logger.error(f"[Job {job_id}] Failed to reassign shift: {str(e)}")
-        with job_lock:
+        with _lock_for(job_id):
             if job_id in jobs:
-                jobs[job_id]["status"] = "SOLVING_FAILED"
-                jobs[job_id]["error"] = f"Shift reassignment failed: {str(e)}"
+                _update_job(
+                    job_id,
+                    status="SOLVING_FAILED",
+                    error=f"Shift reassignment failed: {str(e)}",
+                )
                 _sync_job_to_store(job_id)
         return False, [f"Internal error: {str(e)}"]
 
 
-def swap_shifts_in_job(job_id: str, shift1_id: str, shift2_id: str) -> bool:
+@_buffered_sync
+def swap_shifts_in_job(
+    job_id: str, shift1_id: str, shift2_id: str
+) -> tuple[bool, str | None]:
     """Swap employee assignments between two shifts in a completed job"""
     try:
-        with job_lock:
+        with _lock_for(job_id):
             if job_id not in jobs:
                 logger.error(f"Job {job_id} not found")
-                return False
+                return False, f"Job {job_id} not found"
 
             job = jobs[job_id]
 
             # Only allow swapping in completed jobs
             if job["status"] != "SOLVING_COMPLETED":
                 logger.error(f"Job {job_id} status is {job['status']}, not completed")
-                return False
+                return False, f"Job {job_id} is not completed"
 
             if "solution" not in job:
                 logger.error(f"Job {job_id} has no solution")
-                return False
+                return False, f"Job {job_id} has no solution"
 
-            # Get the current solution
-            current_solution = job["solution"]
+            # Work on a copy so the stored solution stays intact until the
+            # updated one is written back
+            current_solution = _working_copy(job["solution"])
 
             # Find the shifts to swap
             shift1 = None
@@ -631,16 +1168,14 @@ def swap_shifts_in_job(job_id: str, shift1_id: str, shift2_id: str) -> bool:
 
             if shift1 is None:
                 logger.error(f"Shift {shift1_id} not found in solution")
-                jobs[job_id]["error"] = f"Shift {shift1_id} not found"
-                return False
+                return False, f"Shift {shift1_id} not found"
 
             if shift2 is None:
                 logger.error(f"Shift {shift2_id} not found in solution")
-                jobs[job_id]["error"] = f"Shift {shift2_id} not found"
-                return False
+                return False, f"Shift {shift2_id} not found"
 
             # Mark job as being modified
-            jobs[job_id]["status"] = "SWAPPING_SHIFTS"
+            _update_job(job_id, status="SWAPPING_SHIFTS")
             _sync_job_to_store(job_id)
 
         # Validate the swap before executing
@@ -661,7 +1196,7 @@ def swap_shifts_in_job(job_id: str, shift1_id: str, shift2_id: str) -> bool:
         ):
             swap_valid = False
             validation_errors.append(
-                f"Employee {employee1.name} lacks skills {shift2.required_skills - employee1.skills} "
+                f"Employee {employee1.name} lacks skills {set(shift2.required_skills) - employee1.skills} "
                 f"required for shift {shift2_id}"
             )
 
@@ -671,7 +1206,7 @@ def swap_shifts_in_job(job_id: str, shift1_id: str, shift2_id: str) -> bool:
         ):
             swap_valid = False
             validation_errors.append(
-                f"Employee {employee2.name} lacks skills {shift1.required_skills - employee2.skills} "
+                f"Employee {employee2.name} lacks skills {set(shift1.required_skills) - employee2.skills} "
                 f"required for shift {shift1_id}"
             )
 
@@ -727,11 +1262,10 @@ def swap_shifts_in_job(job_id: str, shift1_id: str, shift2_id: str) -> bool:
         if not swap_valid:
             error_msg = f"Swap validation failed: {'; '.join(validation_errors)}"
             logger.error(f"[Job {job_id}] {error_msg}")
-            with job_lock:
-                jobs[job_id]["status"] = "SOLVING_FAILED"
-                jobs[job_id]["error"] = error_msg
+            with _lock_for(job_id):
+                _update_job(job_id, status="SOLVING_FAILED", error=error_msg)
                 _sync_job_to_store(job_id)
-            return False
+            return False, error_msg
 
         logger.info(f"[Job {job_id}] Swap validation passed, executing swap...")
 
@@ -741,22 +1275,19 @@ def swap_shifts_in_job(job_id: str, shift1_id: str, shift2_id: str) -> bool:
         shift2.employee = employee1
 
         # Use solver to validate and potentially improve the solution after swap
-        solver = solver_factory.build_solver()
-
         logger.info(f"[Job {job_id}] Running solver to validate swap...")
-        updated_solution = solver.solve(current_solution)
+        with pooled_solver() as solver:
+            updated_solution = solver.solve(current_solution)
 
         # Update the job with new solution
-        with job_lock:
-            jobs[job_id]["status"] = "SOLVING_COMPLETED"
-            jobs[job_id]["solution"] = updated_solution
-            jobs[job_id]["updated_at"] = datetime.now()
-            jobs[job_id]["final_score"] = str(updated_solution.score)
-
+        now = datetime.now()
+        with _lock_for(job_id):
             # Track the swap
-            if "shift_swaps" not in jobs[job_id]:
-                jobs[job_id]["shift_swaps"] = []
-            jobs[job_id]["shift_swaps"].append(
+            job = _publish_solution(
+                job_id,
+                updated_solution,
+                now,
+                "shift_swaps",
                 {
                     "shift1_id": shift1_id,
                     "shift2_id": shift2_id,
@@ -764,14 +1295,12 @@ def swap_shifts_in_job(job_id: str, shift1_id: str, shift2_id: str) -> bool:
                     "employee1_name": employee1.name if employee1 else None,
                     "employee2_id": employee2.id if employee2 else None,
                     "employee2_name": employee2.name if employee2 else None,
-                    "timestamp": datetime.now(),
-                }
+                    "timestamp": now,
+                },
             )
             _sync_job_to_store(job_id)
 
-        total_assigned = sum(
-            1 for s in updated_solution.shifts if s.employee is not None
-        )
+        total_assigned = job["assigned_count"]
 
         logger.info(
             f"[Job {job_id}] Shift swap completed successfully. "
@@ -779,293 +1308,269 @@ def swap_shifts_in_job(job_id: str, shift1_id: str, shift2_id: str) -> bool:
             f"Total assigned shifts: {total_assigned}/{len(updated_solution.shifts)}"
         )
 
-        return True
+        return True, None
 
     except Exception as e:
         logger.error(f"[Job {job_id}] Failed to swap shifts: {str(e)}")
-        with job_lock:
+        with _lock_for(job_id):
             if job_id in jobs:
-                jobs[job_id]["status"] = "SOLVING_FAILED"
-                jobs[job_id]["error"] = f"Shift swap failed: {str(e)}"
+                _update_job(
+                    job_id,
+                    status="SOLVING_FAILED",
+                    error=f"Shift swap failed: {str(e)}",
+                )
                 _sync_job_to_store(job_id)
-        return False
+        return False, f"Shift swap failed: {str(e)}"
+
+
+def _employee_field_errors(employee) -> list[str]:
+    """Validate the required fields of an employee to be added"""
+    errors = []
+    if not employee.name.strip():
+        errors.append("Employee name cannot be empty")
+    if not employee.skills:
+        errors.append("Employee must have at least one skill")
+    if not employee.id.strip():
+        errors.append("Employee ID cannot be empty")
+    return errors
+
+
+def _batch_error_result(error: str) -> dict:
+    """Build the result of a batch addition rejected before validation"""
+    return {
+        "error": error,
+        "results": [],
+        "successful_additions": 0,
+        "failed_additions": 0,
+        "skipped_additions": 0,
+    }
+
+
+def _new_employee_result(employee) -> dict[str, Any]:
+    """Start the reported result of one employee in a batch addition"""
+    return {
+        "employee_id": employee.id,
+        "employee_name": employee.name,
+        "status": "PENDING",
+        "message": "",
+        "errors": [],
+        "warnings": [],
+        "assigned_shifts": 0,
+    }
+
+
+def _validate_new_employees(
+    new_employees: list, existing_employee_ids: set[str]
+) -> tuple[list[dict[str, Any]], list, dict[str, int]]:
+    """Validate employees to be added, return their results, the valid ones and counts"""
+    results = []
+    employees_to_add = []
+    new_employee_ids: set[str] = set()
+    counts = {"successful_additions": 0, "failed_additions": 0, "skipped_additions": 0}
+
+    for employee in new_employees:
+        employee_result = _new_employee_result(employee)
+
+        # Check for duplicate ID within existing employees
+        if employee.id in existing_employee_ids:
+            employee_result["status"] = "SKIPPED"
+            employee_result["message"] = (
+                f"Employee ID {employee.id} already exists in job"
+            )
+            employee_result["errors"].append("Duplicate employee ID")
+            counts["skipped_additions"] += 1
+
+        # Check for duplicate ID within the batch
+        elif employee.id in new_employee_ids:
+            employee_result["status"] = "FAILED"
+            employee_result["message"] = f"Duplicate employee ID {employee.id} in batch"
+            employee_result["errors"].append("Duplicate ID in batch")
+            counts["failed_additions"] += 1
+
+        # Check required fields
+        elif errors := _employee_field_errors(employee):
+            employee_result["status"] = "FAILED"
+            employee_result["message"] = f"Validation failed: {'; '.join(errors)}"
+            employee_result["errors"] = errors
+            counts["failed_additions"] += 1
+
+        else:
+            employee_result["status"] = "VALIDATED"
+            employee_result["message"] = "Ready to add"
+            new_employee_ids.add(employee.id)
+            employees_to_add.append(employee)
+
+        results.append(employee_result)
+
+    return results, employees_to_add, counts
+
+
+def _solve_with_pinned_assignments(
+    job_id: str, solution: ShiftSchedule, was_feasible: bool
+) -> ShiftSchedule:
+    """Re-optimize a solution while its valid assignments stay pinned"""
+    pinned_ids, unpinned_violations = _pin_valid_assignments(
+        job_id, solution, assume_valid=was_feasible
+    )
+    logger.info(
+        f"[Job {job_id}] Pinned {len(pinned_ids)} valid assignments, "
+        f"left {unpinned_violations} constraint violations unpinned for fixing"
+    )
 
+    with pooled_solver() as solver:
+        updated_solution = solver.solve(solution)
 
+    # Unpin only the shifts pinned for this solve
+    for shift in updated_solution.shifts:
+        if shift.id in pinned_ids:
+            shift.pinned = False
+    return updated_solution
+
+
+@_buffered_sync
 def add_employees_to_completed_job(
     job_id: str, new_employees: list, auto_assign: bool = False
 ) -> tuple[bool, dict]:
     """Add multiple employees to completed job with validation and detailed reporting"""
-    successful_additions = 0
-    failed_additions = 0
-    skipped_additions = 0
+    validation_results: list[dict[str, Any]] = []
+    counts = {"successful_additions": 0, "failed_additions": 0, "skipped_additions": 0}
 
     try:
-        with job_lock:
+        with _lock_for(job_id):
             if job_id not in jobs:
                 logger.error(f"Job {job_id} not found")
-                return False, {
-                    "error": "Job not found",
-                    "results": [],
-                    "successful_additions": 0,
-                    "failed_additions": 0,
-                    "skipped_additions": 0,
-                }
+                return False, _batch_error_result("Job not found")
 
             job = jobs[job_id]
 
             # Only allow adding to completed jobs
             if job["status"] != "SOLVING_COMPLETED":
                 logger.error(f"Job {job_id} status is {job['status']}, not completed")
-                return False, {
-                    "error": f"Job status is {job['status']}, not completed",
-                    "results": [],
-                    "successful_additions": 0,
-                    "failed_additions": 0,
-                    "skipped_additions": 0,
-                }
+                return False, _batch_error_result(
+                    f"Job status is {job['status']}, not completed"
+                )
 
             if "solution" not in job:
                 logger.error(f"Job {job_id} has no solution")
-                return False, {
-                    "error": "Job has no solution",
-                    "results": [],
-                    "successful_additions": 0,
-                    "failed_additions": 0,
-                    "skipped_additions": 0,
-                }
+                return False, _batch_error_result("Job has no solution")
 
-            # Get the current solution
-            current_solution = job["solution"]
+            # Phase 1: Validate all employees before adding any
+            logger.info(
+                f"[Job {job_id}] Starting batch validation of "
+                f"{len(new_employees)} employees"
+            )
+            validation_results, employees_to_add, counts = _validate_new_employees(
+                new_employees, {emp.id for emp in job["solution"].employees}
+            )
+            logger.info(
+                f"[Job {job_id}] Validation complete. Valid: {len(employees_to_add)}, "
+                f"Failed: {counts['failed_additions']}, "
+                f"Skipped: {counts['skipped_additions']}"
+            )
+
+            if not employees_to_add:
+                # Rejected employees leave the job untouched
+                logger.info(f"[Job {job_id}] No valid employees to add")
+                return True, {"results": validation_results, **counts}
+
+            # Work on a copy so the stored solution stays intact until the
+            # updated one is written back
+            current_solution = _working_copy(job["solution"])
+            was_feasible = job.get("was_feasible", False)
 
             # Mark job as being modified
-            jobs[job_id]["status"] = "ADDING_EMPLOYEES_BATCH"
+            _update_job(job_id, status="ADDING_EMPLOYEES_BATCH")
             _sync_job_to_store(job_id)
 
-        # Phase 1: Validate all employees before adding any
+        # Phase 2: Add the valid employees
+        current_solution.employees.extend(employees_to_add)
         logger.info(
-            f"[Job {job_id}] Starting batch validation of {len(new_employees)} employees"
+            f"[Job {job_id}] Added {len(employees_to_add)} employees: "
+            f"{[employee.name for employee in employees_to_add]}"
         )
-
-        validation_results = []
-        existing_employee_ids = {emp.id for emp in current_solution.employees}
-        new_employee_ids = set()
-
-        for employee in new_employees:
-            employee_result = {
-                "employee_id": employee.id,
-                "employee_name": employee.name,
-                "status": "PENDING",
-                "message": "",
-                "errors": [],
-                "warnings": [],
-                "assigned_shifts": 0,
-            }
-
-            # Check for duplicate ID within existing employees
-            if employee.id in existing_employee_ids:
-                employee_result["status"] = "SKIPPED"
-                employee_result["message"] = (
-                    f"Employee ID {employee.id} already exists in job"
+        if logger.isEnabledFor(logging.DEBUG):
+            for employee in employees_to_add:
+                logger.debug(
+                    "[Job %s] Employee %s skills: %s",
+                    job_id,
+                    employee.name,
+                    employee.skills,
                 )
-                employee_result["errors"].append("Duplicate employee ID")
-                skipped_additions += 1
 
-            # Check for duplicate ID within the batch
-            elif employee.id in new_employee_ids:
-                employee_result["status"] = "FAILED"
-                employee_result["message"] = (
-                    f"Duplicate employee ID {employee.id} in batch"
-                )
-                employee_result["errors"].append("Duplicate ID in batch")
-                failed_additions += 1
-
-            else:
-                # Validate required fields
-                errors = []
-                if not employee.name.strip():
-                    errors.append("Employee name cannot be empty")
-                if not employee.skills:
-                    errors.append("Employee must have at least one skill")
-                if not employee.id.strip():
-                    errors.append("Employee ID cannot be empty")
-
-                if errors:
-                    employee_result["status"] = "FAILED"
-                    employee_result["message"] = (
-                        f"Validation failed: {'; '.join(errors)}"
-                    )
-                    employee_result["errors"] = errors
-                    failed_additions += 1
-                else:
-                    employee_result["status"] = "VALIDATED"
-                    employee_result["message"] = "Ready to add"
-                    new_employee_ids.add(employee.id)
-
-            validation_results.append(employee_result)
-
-        logger.info(
-            f"[Job {job_id}] Validation complete. Valid: {len(new_employee_ids)}, "
-            f"Failed: {failed_additions}, Skipped: {skipped_additions}"
-        )
-
-        # Phase 2: Add valid employees if any exist
-        if new_employee_ids:
+        # Run solver only if auto_assign is True
+        if auto_assign:
             logger.info(
-                f"[Job {job_id}] Adding {len(new_employee_ids)} valid employees "
-                f"using batch optimization"
+                f"[Job {job_id}] Running solver with {len(employees_to_add)} new employees..."
             )
-
-            # Pin all existing assignments to preserve them during re-optimization
-            pinned_count = 0
-            unpinned_violations = 0
-
-            for shift in current_solution.shifts:
-                if shift.employee is not None and not shift.pinned:
-                    # Check if current assignment has constraint violations
-                    current_emp = shift.employee
-                    has_violation = False
-
-                    # Check for hard constraint violations that should be fixed
-                    if not current_emp.has_required_skills(shift.required_skills):
-                        has_violation = True
-                        unpinned_violations += 1
-                        logger.info(
-                            f"[Job {job_id}] Not pinning shift {shift.id} due to skill mismatch"
-                        )
-                    elif current_emp.is_unavailable_on_date(shift.start_time):
-                        has_violation = True
-                        unpinned_violations += 1
-                        logger.info(
-                            f"[Job {job_id}] Not pinning shift {shift.id} due to unavailability"
-                        )
-
-                    # Only pin assignments without violations
-                    if not has_violation:
-                        shift.pin()
-                        pinned_count += 1
-
+            updated_solution = _solve_with_pinned_assignments(
+                job_id, current_solution, was_feasible
+            )
+            assigned_counts = Counter(
+                shift.employee.id for shift in updated_solution.shifts if shift.employee
+            )
+        else:
             logger.info(
-                f"[Job {job_id}] Pinned {pinned_count} valid assignments, "
-                f"left {unpinned_violations} constraint violations unpinned for fixing"
+                f"[Job {job_id}] Adding {len(employees_to_add)} employees "
+                f"without auto-assignment"
             )
+            updated_solution = current_solution
 
-            # Add all valid employees to the solution
-            employees_to_add = []
-            for i, employee in enumerate(new_employees):
-                if validation_results[i]["status"] == "VALIDATED":
-                    current_solution.employees.append(employee)
-                    employees_to_add.append(employee)
-                    logger.info(
-                        f"[Job {job_id}] Added employee {employee.name} with skills: {employee.skills}"
-                    )
-
-            # Run solver only if auto_assign is True
+        for employee_result in validation_results:
+            if employee_result["status"] != "VALIDATED":
+                continue
             if auto_assign:
-                # Use existing solver factory with pinned assignments
-                solver = solver_factory.build_solver()
-
-                logger.info(
-                    f"[Job {job_id}] Running solver with {len(employees_to_add)} new employees..."
+                assigned_count = assigned_counts[employee_result["employee_id"]]
+                employee_result["assigned_shifts"] = assigned_count
+                employee_result["message"] = (
+                    f"Successfully added and assigned to {assigned_count} shifts"
                 )
-                updated_solution = solver.solve(current_solution)
-
-                # Unpin shifts for future modifications
-                for shift in updated_solution.shifts:
-                    if shift.pinned:
-                        shift.pinned = False
-
-                # Update results with assignment counts
-                for i, employee in enumerate(new_employees):
-                    if validation_results[i]["status"] == "VALIDATED":
-                        assigned_count = sum(
-                            1
-                            for shift in updated_solution.shifts
-                            if shift.employee and shift.employee.id == employee.id
-                        )
-                        validation_results[i]["assigned_shifts"] = assigned_count
-                        validation_results[i]["status"] = "SUCCESS"
-                        validation_results[i]["message"] = (
-                            f"Successfully added and assigned to {assigned_count} shifts"
-                        )
-                        successful_additions += 1
             else:
-                # Don't run solver, just add employees without assignments
-                logger.info(
-                    f"[Job {job_id}] Adding {len(employees_to_add)} employees "
-                    f"without auto-assignment"
-                )
-                updated_solution = current_solution
-
-                # Update results without assignment counts
-                for i, _employee in enumerate(new_employees):
-                    if validation_results[i]["status"] == "VALIDATED":
-                        validation_results[i]["assigned_shifts"] = 0
-                        validation_results[i]["status"] = "SUCCESS"
-                        validation_results[i]["message"] = (
-                            "Successfully added (no auto-assignment)"
-                        )
-                        successful_additions += 1
+                employee_result["message"] = "Successfully added (no auto-assignment)"
+            employee_result["status"] = "SUCCESS"
+            counts["successful_additions"] += 1
 
-            # Update the job with new solution
-            with job_lock:
-                jobs[job_id]["status"] = "SOLVING_COMPLETED"
-                jobs[job_id]["solution"] = updated_solution
-                jobs[job_id]["updated_at"] = datetime.now()
-                jobs[job_id]["final_score"] = str(updated_solution.score)
-
-                # Track the batch addition
-                if "batch_employee_additions" not in jobs[job_id]:
-                    jobs[job_id]["batch_employee_additions"] = []
-                jobs[job_id]["batch_employee_additions"].append(
-                    {
-                        "timestamp": datetime.now(),
-                        "total_employees": len(new_employees),
-                        "successful_additions": successful_additions,
-                        "failed_additions": failed_additions,
-                        "skipped_additions": skipped_additions,
-                        "auto_assign": auto_assign,
-                        "employee_results": validation_results,
-                    }
-                )
-                _sync_job_to_store(job_id)
-
-            total_assigned = sum(
-                1 for s in updated_solution.shifts if s.employee is not None
+        # Update the job with new solution
+        now = datetime.now()
+        with _lock_for(job_id):
+            # Track the batch addition
+            job = _publish_solution(
+                job_id,
+                updated_solution,
+                now,
+                "batch_employee_additions",
+                {
+                    "timestamp": now,
+                    "total_employees": len(new_employees),
+                    **counts,
+                    "auto_assign": auto_assign,
+                    "employee_results": validation_results,
+                },
             )
+            _sync_job_to_store(job_id)
 
-            logger.info(
-                f"[Job {job_id}] Batch employee addition completed. "
-                f"Score: {updated_solution.score}, "
-                f"Total assigned shifts: {total_assigned}/{len(updated_solution.shifts)}, "
-                f"Successful additions: {successful_additions}, "
-                f"Failed additions: {failed_additions}, "
-                f"Skipped additions: {skipped_additions}"
-            )
-        else:
-            # No valid employees to add
-            logger.info(f"[Job {job_id}] No valid employees to add")
-            with job_lock:
-                jobs[job_id]["status"] = "SOLVING_COMPLETED"
-                _sync_job_to_store(job_id)
+        logger.info(
+            f"[Job {job_id}] Batch employee addition completed. "
+            f"Score: {updated_solution.score}, "
+            f"Total assigned shifts: {job['assigned_count']}/{len(updated_solution.shifts)}, "
+            f"Successful additions: {counts['successful_additions']}, "
+            f"Failed additions: {counts['failed_additions']}, "
+            f"Skipped additions: {counts['skipped_additions']}"
+        )
 
-        return True, {
-            "results": validation_results,
-            "successful_additions": successful_additions,
-            "failed_additions": failed_additions,
-            "skipped_additions": skipped_additions,
-        }
+        return True, {"results": validation_results, **counts}
 
     except Exception as e:
         logger.error(f"[Job {job_id}] Failed to add employees in batch: {str(e)}")
-        with job_lock:
+        with _lock_for(job_id):
             if job_id in jobs:
-                jobs[job_id]["status"] = "SOLVING_FAILED"
-                jobs[job_id]["error"] = f"Batch employee addition failed: {str(e)}"
+                _update_job(
+                    job_id,
+                    status="SOLVING_FAILED",
+                    error=f"Batch employee addition failed: {str(e)}",
+                )
                 _sync_job_to_store(job_id)
         return False, {
             "error": f"Internal error: {str(e)}",
             "results": validation_results,
-            "successful_additions": successful_additions,
-            "failed_additions": failed_additions,
-            "skipped_additions": skipped_additions,
+            **counts,
         }
@@ -2,30 +2,65 @@
 API route handlers
 """
 
-import threading
+import asyncio
+import logging
+import os
+import re
+import time
 import uuid
-from datetime import datetime
-
-from fastapi import APIRouter, HTTPException
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from typing import Any, TypeVar
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
+from fastapi.responses import (
+    HTMLResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 
+from ..core.models import ShiftSchedule
 from ..utils import create_demo_schedule
 from .analysis import analyze_weekly_hours, generate_recommendations
-from .converters import convert_domain_to_response, convert_request_to_domain
+from .converters import (
+    convert_domain_to_response,
+    convert_employee_request_to_domain,
+    convert_request_to_domain,
+    iter_domain_response_json,
+)
 from .job_store import job_store
 from .jobs import (
-    _sync_job_to_store,
+    ACTIVE_STATUSES,
     add_employee_to_completed_job,
     add_employees_to_completed_job,
+    assigned_shift_count,
+    delete_stored_job,
+    find_employee,
+    find_shift,
+    get_job,
+    get_jobs_snapshot,
+    job_ids_created_before,
     job_lock,
-    jobs,
+    list_job_summaries,
+    load_job,
+    prune_job_index,
     reassign_shift_in_job,
-    solve_problem_async,
+    register_job,
+    remove_job,
+    solution_etag,
+    submit_solve,
     swap_shifts_in_job,
+    sync_job,
+    unindex_job,
     update_employee_skills,
+    wait_for_job,
 )
 from .schemas import (
     BatchEmployeeRequest,
     BatchEmployeeResponse,
+    EmployeeAdditionResult,
     EmployeeRequest,
     ReassignShiftRequest,
     ReassignShiftResponse,
@@ -35,10 +70,46 @@ from .schemas import (
     SwapShiftsRequest,
     SwapShiftsResponse,
 )
-from .solver import solver_factory
+from .solver import (
+    SOLVER_LOG_LEVEL,
+    SOLVER_POOL,
+    SOLVER_TIMEOUT_SECONDS,
+    pooled_solver,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Longest a client may hold a request open waiting for a solve to finish
+MAX_WAIT_SECONDS = float(os.getenv("MAX_WAIT_SECONDS", "60"))
+
+# Create router; JSON responses are serialized with orjson
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+async def _load_job_async(job_id: str) -> dict[str, Any] | None:
+    """Return a job, reading persistent storage off the event loop if needed"""
+    job = get_job(job_id)
+    if job is None and job_store:
+        job = await asyncio.to_thread(load_job, job_id)
+    return job
 
-# Create router
-router = APIRouter()
+
+async def _run_on_solver_pool(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking, solver-backed job operation off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(SOLVER_POOL, func, *args)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header covers the given tag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    # If-None-Match uses the weak comparison, ignoring W/ prefixes
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags or "*" in tags
 
 
 @router.get("/")
@@ -60,92 +131,134 @@ async def health_check():
 @router.get("/api/shifts/demo")
 async def get_demo_data():
     """Get demo data"""
-    schedule = create_demo_schedule()
+    schedule = create_demo_schedule(shared=True)
     return convert_domain_to_response(schedule)
 
 
 @router.post("/api/shifts/solve", response_model=SolveResponse)
-async def solve_shifts(request: ShiftScheduleRequest):
+async def solve_shifts(
+    request: ShiftScheduleRequest, background_tasks: BackgroundTasks
+):
     """Shift optimization (asynchronous)"""
     job_id = str(uuid.uuid4())
     problem = convert_request_to_domain(request)
 
     # Register job
     with job_lock:
-        jobs[job_id] = {
-            "status": "SOLVING_SCHEDULED",
-            "created_at": datetime.now(),
-            "problem": problem,
-        }
-        _sync_job_to_store(job_id)
+        register_job(
+            job_id,
+            {
+                "status": "SOLVING_SCHEDULED",
+                "created_at": datetime.now(),
+                "problem": problem,
+            },
+        )
+
+    # Persist the new job after the response is sent
+    background_tasks.add_task(sync_job, job_id)
 
-    # Start optimization asynchronously
-    thread = threading.Thread(target=solve_problem_async, args=(job_id, problem))
-    thread.daemon = True
-    thread.start()
+    # Queue optimization on the bounded solve executor
+    submit_solve(job_id, problem)
 
     return SolveResponse(job_id=job_id, status="SOLVING_SCHEDULED")
 
 
 @router.get("/api/shifts/solve/{job_id}", response_model=SolutionResponse)
-async def get_solution(job_id: str):
+async def get_solution(job_id: str, request: Request):
     """Get optimization result"""
-    with job_lock:
-        # First check in-memory jobs
-        if job_id not in jobs and job_store:
-            # Try to load from persistent storage
-            stored_job = job_store.get_job(job_id)
-            if stored_job:
-                jobs[job_id] = stored_job
-
-        if job_id not in jobs:
-            raise HTTPException(status_code=404, detail="Job not found")
+    # Check in-memory jobs, then persistent storage
+    job = await _load_job_async(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-        job = jobs[job_id]
+    if job["status"] == "SOLVING_COMPLETED":
+        etag = solution_etag(job_id, job)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
 
-        response = SolutionResponse(
-            job_id=job_id, status=job["status"], html_report_url=None
+        # Stream the solution instead of building the whole response in memory
+        return StreamingResponse(
+            _iter_solution_response_json(
+                job_id, job["solution"], assigned_shift_count(job)
+            ),
+            media_type="application/json",
+            headers={"ETag": etag},
         )
 
-        if job["status"] == "SOLVING_COMPLETED":
-            solution = job["solution"]
-            response.solution = convert_domain_to_response(solution)
-            response.score = str(solution.score)
-            response.assigned_shifts = solution.get_assigned_shift_count()
-            response.unassigned_shifts = solution.get_unassigned_shift_count()
-            response.html_report_url = f"/api/shifts/solve/{job_id}/html"
-        elif job["status"] == "SOLVING_FAILED":
-            response.message = job.get("error", "Unknown error occurred")
+    response = SolutionResponse(
+        job_id=job_id, status=job["status"], html_report_url=None
+    )
 
-        return response
+    if job["status"] == "SOLVING_FAILED":
+        response.message = job.get("error", "Unknown error occurred")
 
+    return response
 
-@router.post("/api/shifts/solve-sync")
-async def solve_shifts_sync(request: ShiftScheduleRequest):
-    """Shift optimization (synchronous)"""
-    import logging
-    from datetime import datetime
 
-    from .solver import SOLVER_LOG_LEVEL, SOLVER_TIMEOUT_SECONDS
+@router.get("/api/shifts/solve/{job_id}/wait", response_model=SolutionResponse)
+async def wait_for_solution(
+    job_id: str,
+    request: Request,
+    # NaN would slip through the clamp below, so non-finite values are rejected
+    timeout: float = Query(30.0, allow_inf_nan=False),
+):
+    """Wait for an optimization to finish, then return its result"""
+    job = await _load_job_async(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job["status"] in ACTIVE_STATUSES:
+        # Long-poll instead of making the client re-request the status
+        timeout = min(max(timeout, 0.0), MAX_WAIT_SECONDS)
+        await wait_for_job(job_id, timeout)
+
+    return await get_solution(job_id, request)
+
+
+def _iter_solution_response_json(
+    job_id: str, solution: ShiftSchedule, assigned_shifts: int
+) -> Iterator[bytes]:
+    """Stream a completed job's SolutionResponse as encoded JSON chunks"""
+    yield (
+        b'{"job_id":'
+        + orjson.dumps(job_id)
+        + b',"status":"SOLVING_COMPLETED","solution":'
+    )
+    yield from iter_domain_response_json(solution, assigned_shifts)
+    tail = orjson.dumps(
+        {
+            "score": str(solution.score),
+            "assigned_shifts": assigned_shifts,
+            "unassigned_shifts": len(solution.shifts) - assigned_shifts,
+            "message": None,
+            "html_report_url": f"/api/shifts/solve/{job_id}/html",
+        }
+    )
+    # Remaining fields, spliced in without the opening brace
+    yield b"," + tail[1:]
 
-    logger = logging.getLogger(__name__)
 
+@router.post("/api/shifts/solve-sync")
+async def solve_shifts_sync(
+    request: ShiftScheduleRequest, background_tasks: BackgroundTasks
+):
+    """Shift optimization (synchronous)"""
     try:
         problem = convert_request_to_domain(request)
-        solver = solver_factory.build_solver()
 
-        start_time = datetime.now()
+        start_time = time.monotonic()
         logger.info(
             f"[Sync] Starting optimization with {len(problem.shifts)} shifts "
             f"and {len(problem.employees)} employees (timeout: {SOLVER_TIMEOUT_SECONDS}s)"
         )
 
-        solution = solver.solve(problem)
+        # Solve off the event loop so other requests are served meanwhile
+        loop = asyncio.get_running_loop()
+        with pooled_solver() as solver:
+            solution = await loop.run_in_executor(SOLVER_POOL, solver.solve, problem)
 
-        elapsed = (datetime.now() - start_time).total_seconds()
-        assigned_count = sum(
-            1 for shift in solution.shifts if shift.employee is not None
-        )
+        elapsed = time.monotonic() - start_time
+        assigned_count = solution.get_assigned_shift_count()
 
         logger.info(
             f"[Sync] Optimization completed in {elapsed:.1f}s. "
@@ -165,17 +278,28 @@ async def solve_shifts_sync(request: ShiftScheduleRequest):
         # For sync solve, we'll need to create a temporary job ID for HTML report
         temp_job_id = str(uuid.uuid4())
         with job_lock:
-            jobs[temp_job_id] = {
-                "status": "SOLVING_COMPLETED",
-                "created_at": datetime.now(),
-                "solution": solution,
-                "temporary": True,  # Mark as temporary for cleanup
-            }
-            _sync_job_to_store(temp_job_id)
+            register_job(
+                temp_job_id,
+                {
+                    "status": "SOLVING_COMPLETED",
+                    "created_at": datetime.now(),
+                    "solution": solution,
+                    "assigned_count": assigned_count,
+                    "temporary": True,  # Mark as temporary for cleanup
+                },
+            )
 
-        result = convert_domain_to_response(solution)
-        result["html_report_url"] = f"/api/shifts/solve/{temp_job_id}/html"
-        return result
+        # Persist the temporary job after the response is sent
+        background_tasks.add_task(sync_job, temp_job_id)
+
+        return StreamingResponse(
+            iter_domain_response_json(
+                solution,
+                assigned_count,
+                extra={"html_report_url": f"/api/shifts/solve/{temp_job_id}/html"},
+            ),
+            media_type="application/json",
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -184,18 +308,18 @@ async def solve_shifts_sync(request: ShiftScheduleRequest):
 @router.get("/api/shifts/weekly-analysis/{job_id}")
 async def get_weekly_analysis(job_id: str):
     """Detailed analysis of weekly working hours"""
-    with job_lock:
-        if job_id not in jobs:
-            raise HTTPException(status_code=404, detail="Job not found")
+    job = await _load_job_async(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-        job = jobs[job_id]
-        if job["status"] != "SOLVING_COMPLETED":
-            raise HTTPException(status_code=400, detail="Job not completed")
+    if job["status"] != "SOLVING_COMPLETED":
+        raise HTTPException(status_code=400, detail="Job not completed")
 
-        solution = job["solution"]
-        analysis = analyze_weekly_hours(solution)
+    solution = job["solution"]
+    loop = asyncio.get_running_loop()
+    analysis = await loop.run_in_executor(None, analyze_weekly_hours, solution)
 
-        return analysis
+    return analysis
 
 
 @router.post("/api/shifts/analyze-weekly")
@@ -203,7 +327,8 @@ async def analyze_weekly_hours_sync(request: ShiftScheduleRequest):
     """Immediate analysis of weekly working hours (without optimization)"""
     try:
         schedule = convert_request_to_domain(request)
-        analysis = analyze_weekly_hours(schedule)
+        loop = asyncio.get_running_loop()
+        analysis = await loop.run_in_executor(None, analyze_weekly_hours, schedule)
         return analysis
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -212,7 +337,7 @@ async def analyze_weekly_hours_sync(request: ShiftScheduleRequest):
 @router.get("/api/shifts/test-weekly")
 async def test_weekly_constraints():
     """Test weekly working hours constraints"""
-    schedule = create_demo_schedule()
+    schedule = create_demo_schedule(shared=True)
     analysis = analyze_weekly_hours(schedule)
 
     return {
@@ -235,34 +360,8 @@ async def test_weekly_constraints():
 @router.get("/api/jobs")
 async def list_jobs():
     """List all jobs (both in-memory and persistent)"""
-    all_job_ids = set(jobs.keys())
-
-    # Add persistent job IDs if available
-    if job_store:
-        all_job_ids.update(job_store.list_jobs())
-
-    job_summaries = []
-    for job_id in all_job_ids:
-        # Try to get from memory first
-        if job_id in jobs:
-            job = jobs[job_id]
-        elif job_store:
-            job = job_store.get_job(job_id)
-        else:
-            continue
-
-        if job:
-            job_summaries.append(
-                {
-                    "job_id": job_id,
-                    "status": job.get("status"),
-                    "created_at": job.get("created_at"),
-                    "completed_at": job.get("completed_at"),
-                }
-            )
-
-    # Sort by created_at descending (newest first)
-    job_summaries.sort(key=lambda x: x.get("created_at") or datetime.min, reverse=True)
+    # Served from the sorted in-memory index, which also covers persisted jobs
+    job_summaries = list_job_summaries()
 
     return {"total": len(job_summaries), "jobs": job_summaries}
 
@@ -274,25 +373,34 @@ async def delete_job(job_id: str):
 
     # Delete from memory
     with job_lock:
-        if job_id in jobs:
-            # Don't delete if actively solving
-            if jobs[job_id].get("status") in ["SOLVING_ACTIVE", "SOLVING_SCHEDULED"]:
-                if "solver" in jobs[job_id]:
+        job = get_job(job_id)
+        if job is not None:
+            # Don't delete if actively solving; a solve still waiting in the
+            # queue is cancelled instead
+            if job.get("status") in ACTIVE_STATUSES:
+                future = job.get("future")
+                if future is not None:
+                    solving = not future.cancel()
+                else:
+                    solving = "solver" in job
+                if solving:
                     raise HTTPException(
                         status_code=400,
                         detail="Cannot delete job that is currently solving",
                     )
-            del jobs[job_id]
+            remove_job(job_id)
             deleted = True
 
     # Delete from persistent storage
     if job_store:
         try:
-            job_store.delete_job(job_id)
+            await asyncio.to_thread(delete_stored_job, job_id)
             deleted = True
         except Exception:
             pass
 
+    unindex_job(job_id)
+
     if not deleted:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -305,27 +413,32 @@ async def cleanup_old_jobs(max_age_hours: int = 24):
     deleted_count = 0
 
     if job_store and hasattr(job_store, "cleanup_old_jobs"):
-        deleted_count = job_store.cleanup_old_jobs(max_age_hours)
-
-    # Also clean up old in-memory jobs
-    with job_lock:
-        cutoff = datetime.now()
-        cutoff = cutoff.replace(hour=cutoff.hour - max_age_hours)
+        deleted_count = await asyncio.to_thread(
+            job_store.cleanup_old_jobs, max_age_hours
+        )
 
-        to_delete = []
-        for job_id, job in jobs.items():
-            # Skip active jobs
-            if job.get("status") in ["SOLVING_ACTIVE", "SOLVING_SCHEDULED"]:
-                continue
+    # Also clean up old in-memory jobs. The listing index is sorted by
+    # created_at, so only jobs created before the cutoff are visited.
+    cutoff = datetime.now() - timedelta(hours=max_age_hours)
 
-            # Check if old enough
-            created_at = job.get("created_at") or job.get("completed_at")
-            if created_at and created_at < cutoff:
-                to_delete.append(job_id)
+    to_delete = [
+        job_id
+        for job_id in job_ids_created_before(cutoff)
+        if (job := get_job(job_id)) is not None
+        and job.get("status") not in ACTIVE_STATUSES
+        and (job.get("created_at") or job.get("completed_at") or datetime.max) < cutoff
+    ]
 
+    with job_lock:
         for job_id in to_delete:
-            del jobs[job_id]
-            deleted_count += 1
+            if remove_job(job_id) is not None:
+                deleted_count += 1
+
+    # Drop listing entries for jobs gone from both memory and storage
+    keep_ids = set(get_jobs_snapshot())
+    if job_store:
+        keep_ids.update(await asyncio.to_thread(job_store.list_jobs))
+    prune_job_index(keep_ids)
 
     return {
         "deleted_count": deleted_count,
@@ -340,18 +453,20 @@ async def cleanup_old_jobs(max_age_hours: int = 24):
 async def add_employee_to_job(job_id: str, employee: EmployeeRequest):
     """Add employee to completed job and re-optimize"""
     # Convert employee to domain model
-    from .converters import convert_employee_request_to_domain
-
     new_employee = convert_employee_request_to_domain(employee)
 
+    # Bring the job back into memory if it was evicted
+    await _load_job_async(job_id)
+
     # Add the employee to the job
-    success = add_employee_to_completed_job(job_id, new_employee)
+    success, error = await _run_on_solver_pool(
+        add_employee_to_completed_job, job_id, new_employee
+    )
 
     if success:
         # Get updated job info
-        with job_lock:
-            job = jobs[job_id]
-            solution = job["solution"]
+        job = get_job(job_id)
+        solution = job["solution"]
 
         return {
             "message": f"Employee {employee.name} added successfully",
@@ -359,37 +474,28 @@ async def add_employee_to_job(job_id: str, employee: EmployeeRequest):
             "employee_id": employee.id,
             "status": "SUCCESS",
             "final_score": str(solution.score),
-            "assigned_shifts": sum(
-                1 for s in solution.shifts if s.employee is not None
-            ),
+            "assigned_shifts": assigned_shift_count(job),
             "total_shifts": len(solution.shifts),
             "html_report_url": f"/api/shifts/solve/{job_id}/html",
         }
     else:
-        # Get error details from job
-        with job_lock:
-            if job_id in jobs:
-                error_msg = jobs[job_id].get("error", "Unknown error occurred")
-            else:
-                error_msg = "Job not found"
-
-        raise HTTPException(status_code=400, detail=error_msg)
+        raise HTTPException(status_code=400, detail=error)
 
 
 @router.post("/api/shifts/{job_id}/add-employees", response_model=BatchEmployeeResponse)
 async def add_employees_to_job(job_id: str, request: BatchEmployeeRequest):
     """Add multiple employees to completed job in batch"""
     # Convert employee requests to domain models
-    from .converters import convert_employee_request_to_domain
-    from .schemas import EmployeeAdditionResult
-
     new_employees = [
         convert_employee_request_to_domain(emp) for emp in request.employees
     ]
 
+    # Bring the job back into memory if it was evicted
+    await _load_job_async(job_id)
+
     # Add the employees to the job
-    success, result_data = add_employees_to_completed_job(
-        job_id, new_employees, request.auto_assign
+    success, result_data = await _run_on_solver_pool(
+        add_employees_to_completed_job, job_id, new_employees, request.auto_assign
     )
 
     if not success:
@@ -436,12 +542,10 @@ async def add_employees_to_job(job_id: str, request: BatchEmployeeRequest):
     final_score = None
     html_report_url = None
     if successful_additions > 0:
-        with job_lock:
-            if job_id in jobs:
-                job = jobs[job_id]
-                if "solution" in job:
-                    final_score = str(job["solution"].score)
-                    html_report_url = f"/api/shifts/solve/{job_id}/html"
+        job = get_job(job_id)
+        if job is not None and "solution" in job:
+            final_score = str(job["solution"].score)
+            html_report_url = f"/api/shifts/solve/{job_id}/html"
 
     return BatchEmployeeResponse(
         job_id=job_id,
@@ -463,21 +567,21 @@ async def update_employee_skills_api(job_id: str, employee_id: str, skills: list
     # Convert skills list to set
     new_skills = set(skills)
 
+    # Bring the job back into memory if it was evicted
+    await _load_job_async(job_id)
+
     # Update the employee skills
-    success = update_employee_skills(job_id, employee_id, new_skills)
+    success, error = await _run_on_solver_pool(
+        update_employee_skills, job_id, employee_id, new_skills
+    )
 
     if success:
         # Get updated job info
-        with job_lock:
-            job = jobs[job_id]
-            solution = job["solution"]
+        job = get_job(job_id)
+        solution = job["solution"]
 
-            # Find the updated employee
-            updated_employee = None
-            for emp in solution.employees:
-                if emp.id == employee_id:
-                    updated_employee = emp
-                    break
+        # Find the updated employee
+        updated_employee = find_employee(job, employee_id)
 
         if updated_employee:
             return {
@@ -488,9 +592,7 @@ async def update_employee_skills_api(job_id: str, employee_id: str, skills: list
                 "updated_skills": list(updated_employee.skills),
                 "status": "SUCCESS",
                 "final_score": str(solution.score),
-                "assigned_shifts": sum(
-                    1 for s in solution.shifts if s.employee is not None
-                ),
+                "assigned_shifts": assigned_shift_count(job),
                 "total_shifts": len(solution.shifts),
                 "html_report_url": f"/api/shifts/solve/{job_id}/html",
             }
@@ -499,40 +601,38 @@ async def update_employee_skills_api(job_id: str, employee_id: str, skills: list
                 status_code=404, detail="Employee not found after update"
             )
     else:
-        # Get error details from job
-        with job_lock:
-            if job_id in jobs:
-                error_msg = jobs[job_id].get("error", "Unknown error occurred")
-            else:
-                error_msg = "Job not found"
-
-        raise HTTPException(status_code=400, detail=error_msg)
+        raise HTTPException(status_code=400, detail=error)
 
 
 @router.post("/api/shifts/{job_id}/swap", response_model=SwapShiftsResponse)
 async def swap_shifts(job_id: str, request: SwapShiftsRequest):
     """Swap employee assignments between two shifts"""
+    # Bring the job back into memory if it was evicted
+    await _load_job_async(job_id)
+
     # Perform the swap
-    success = swap_shifts_in_job(job_id, request.shift1_id, request.shift2_id)
+    success, error = await _run_on_solver_pool(
+        swap_shifts_in_job, job_id, request.shift1_id, request.shift2_id
+    )
 
     if success:
         # Get updated job info
-        with job_lock:
-            job = jobs[job_id]
-            solution = job["solution"]
+        job = get_job(job_id)
+        solution = job["solution"]
 
         # Find the swapped shifts to show current assignments
-        shift1_employee = None
-        shift2_employee = None
-        for shift in solution.shifts:
-            if shift.id == request.shift1_id:
-                shift1_employee = (
-                    shift.employee.name if shift.employee else "unassigned"
-                )
-            elif shift.id == request.shift2_id:
-                shift2_employee = (
-                    shift.employee.name if shift.employee else "unassigned"
-                )
+        shift1 = find_shift(job, request.shift1_id)
+        shift2 = find_shift(job, request.shift2_id)
+        shift1_employee = (
+            (shift1.employee.name if shift1.employee else "unassigned")
+            if shift1
+            else None
+        )
+        shift2_employee = (
+            (shift2.employee.name if shift2.employee else "unassigned")
+            if shift2
+            else None
+        )
 
         return SwapShiftsResponse(
             job_id=job_id,
@@ -544,38 +644,33 @@ async def swap_shifts(job_id: str, request: SwapShiftsRequest):
             html_report_url=f"/api/shifts/solve/{job_id}/html",
         )
     else:
-        # Get error details from job
-        with job_lock:
-            if job_id in jobs:
-                error_msg = jobs[job_id].get("error", "Unknown error occurred")
-            else:
-                error_msg = "Job not found"
-
-        raise HTTPException(status_code=400, detail=error_msg)
+        raise HTTPException(status_code=400, detail=error)
 
 
 @router.post("/api/shifts/{job_id}/reassign", response_model=ReassignShiftResponse)
 async def reassign_shift(job_id: str, request: ReassignShiftRequest):
     """Reassign a shift to a specific employee or unassign it"""
+    # Bring the job back into memory if it was evicted
+    await _load_job_async(job_id)
+
     # Perform the reassignment
-    success, warnings_or_errors = reassign_shift_in_job(
-        job_id, request.shift_id, request.employee_id, request.force
+    success, warnings_or_errors = await _run_on_solver_pool(
+        reassign_shift_in_job,
+        job_id,
+        request.shift_id,
+        request.employee_id,
+        request.force,
     )
 
     if success:
         # Get updated job info
-        with job_lock:
-            job = jobs[job_id]
-            solution = job["solution"]
+        job = get_job(job_id)
+        solution = job["solution"]
 
         # Find the reassigned shift to get current assignment
-        current_employee = None
-        current_employee_name = None
-        for shift in solution.shifts:
-            if shift.id == request.shift_id:
-                current_employee = shift.employee
-                current_employee_name = shift.employee.name if shift.employee else None
-                break
+        shift = find_shift(job, request.shift_id)
+        current_employee = shift.employee if shift else None
+        current_employee_name = current_employee.name if current_employee else None
 
         return ReassignShiftResponse(
             job_id=job_id,
@@ -589,54 +684,78 @@ async def reassign_shift(job_id: str, request: ReassignShiftRequest):
             html_report_url=f"/api/shifts/solve/{job_id}/html",
         )
     else:
-        # Get error details from job
-        with job_lock:
-            if job_id in jobs:
-                error_msg = jobs[job_id].get("error", "Unknown error occurred")
-            else:
-                error_msg = "Job not found"
-
         # Use the specific errors returned from the function
-        if warnings_or_errors:
-            error_msg = "; ".join(warnings_or_errors)
-
+        error_msg = "; ".join(warnings_or_errors) or "Unknown error occurred"
         raise HTTPException(status_code=400, detail=error_msg)
 
 
 # HTML Report Generation
 @router.get("/api/shifts/solve/{job_id}/html")
-async def get_solution_html(job_id: str):
+async def get_solution_html(job_id: str, request: Request):
     """Get optimization result as HTML report"""
-    from fastapi.responses import HTMLResponse
+    job = await _load_job_async(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    with job_lock:
-        if job_id not in jobs:
-            raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] != "SOLVING_COMPLETED":
+        raise HTTPException(status_code=400, detail="Job not completed")
 
-        job = jobs[job_id]
+    etag = solution_etag(job_id, job)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
-        if job["status"] != "SOLVING_COMPLETED":
-            raise HTTPException(status_code=400, detail="Job not completed")
+    solution = job["solution"]
+    solution_data = convert_domain_to_response(solution)
 
-        solution = job["solution"]
-        solution_data = convert_domain_to_response(solution)
+    # Generate HTML report with embedded data
+    html_content = generate_html_report_with_data(solution_data)
 
-        # Generate HTML report with embedded data
-        html_content = generate_html_report_with_data(solution_data)
+    return HTMLResponse(content=html_content, headers={"ETag": etag})
 
-        return HTMLResponse(content=html_content)
 
+# Template placeholder that the embedded solution data replaces
+_TEMPLATE_SEARCH_PATTERN = (
+    'placeholder=\'{"solution": {"employees": [...], "shifts": [...]}}\''
+)
+_REPLACEMENT_START = (
+    b'placeholder=\'{"solution": {"employees": [...], "shifts": [...]}}\' '
+    b'style="display:none;">'
+)
+# The button label is "シフト表を生成", UTF-8 encoded
+_REPLACEMENT_END = (
+    b'</textarea>\n            <button onclick="generateSchedule()">'
+    b"\xe3\x82\xb7\xe3\x83\x95\xe3\x83\x88\xe8\xa1\xa8"
+    b"\xe3\x82\x92\xe7\x94\x9f\xe6\x88\x90"
+    b"</button>"
+)
 
-def generate_html_report_with_data(solution_data):
-    """Generate HTML report with embedded solution data"""
-    import json
-    import logging
+# Matches the template's placeholder attributes, for diagnosing a missing pattern
+_PLACEHOLDER_RE = re.compile(r"placeholder=\'[^\']*\'>")
 
-    logger = logging.getLogger(__name__)
+# Auto-generation script that runs after page loads
+_AUTO_SCRIPT = """
+    <script>
+    window.addEventListener('load', function() {
+        // Hide the input section since we're auto-generating
+        const inputSection = document.querySelector('.data-input');
+        if (inputSection) {
+            inputSection.style.display = 'none';
+        }
+
+        // Small delay to ensure all elements are loaded
+        setTimeout(function() {
+            // Auto-generate the schedule
+            if (typeof generateSchedule === 'function') {
+                generateSchedule();
+            }
+        }, 100);
+    });
+    </script>
+    """
 
-    # Read the template file from project directory
-    import os
 
+def _load_and_split_template() -> tuple[bytes, bytes] | None:
+    """Read the report template once and split it around the data placeholder"""
     current_dir = os.path.dirname(os.path.abspath(__file__))
     template_path = os.path.join(current_dir, "shift-schedule-template.html")
     try:
@@ -647,69 +766,61 @@ def generate_html_report_with_data(solution_data):
         )
     except FileNotFoundError as e:
         logger.error(f"Template file not found at {template_path}: {e}")
-        # Fallback to simple HTML if template not found
-        return generate_simple_html_report(solution_data)
+        return None
     except Exception as e:
         logger.error(f"Error reading template file: {e}")
-        return generate_simple_html_report(solution_data)
-
-    # Prepare solution data with proper structure
-    solution_json = json.dumps(
-        {"solution": solution_data}, ensure_ascii=False, indent=2
-    )
+        return None
 
     # Check if the replacement pattern exists
-    search_pattern = (
-        'placeholder=\'{"solution": {"employees": [...], "shifts": [...]}}\''
-    )
-    if search_pattern not in html_template:
+    marker = _TEMPLATE_SEARCH_PATTERN + ">\n            </textarea>"
+    index = html_template.find(marker)
+    if index == -1:
         logger.error(
-            f"Search pattern not found in template. Looking for: {search_pattern}"
+            f"Search pattern not found in template. Looking for: {_TEMPLATE_SEARCH_PATTERN}"
         )
         # Find actual pattern for debugging
-        import re
-
-        patterns = re.findall(r"placeholder=\'[^\']*\'>", html_template)
+        patterns = _PLACEHOLDER_RE.findall(html_template)
         logger.error(f"Found patterns: {patterns}")
-        return generate_simple_html_report(solution_data)
+        return None
 
-    # Replace the textarea content with actual data
-    replacement = f'placeholder=\'{{"solution": {{"employees": [...], "shifts": [...]}}}}\' style="display:none;">{solution_json}</textarea>\n            <button onclick="generateSchedule()">シフト表を生成</button>'
-    html_content = html_template.replace(
-        search_pattern + ">\n            </textarea>", replacement
-    )
+    prefix = html_template[:index]
+    suffix = html_template[index + len(marker) :]
+    suffix = suffix.replace("</body>", _AUTO_SCRIPT + "</body>")
+    return prefix.encode(), suffix.encode()
 
-    # Add auto-generation script that runs after page loads
-    auto_script = """
-    <script>
-    window.addEventListener('load', function() {
-        // Hide the input section since we're auto-generating
-        const inputSection = document.querySelector('.data-input');
-        if (inputSection) {
-            inputSection.style.display = 'none';
-        }
 
-        // Small delay to ensure all elements are loaded
-        setTimeout(function() {
-            // Auto-generate the schedule
-            if (typeof generateSchedule === 'function') {
-                generateSchedule();
-            }
-        }, 100);
-    });
-    </script>
-    """
+# The template is static, so it is read and split once at import
+_TEMPLATE_PARTS = _load_and_split_template()
 
-    html_content = html_content.replace("</body>", auto_script + "</body>")
 
-    logger.info(f"Generated HTML with template, final size: {len(html_content)} chars")
+def generate_html_report_with_data(solution_data):
+    """Generate HTML report with embedded solution data"""
+    if _TEMPLATE_PARTS is None:
+        # Fallback to simple HTML if template not available
+        return generate_simple_html_report(solution_data)
+
+    # Prepare solution data with proper structure
+    solution_json = orjson.dumps(
+        {"solution": solution_data}, option=orjson.OPT_INDENT_2
+    )
+
+    template_prefix, template_suffix = _TEMPLATE_PARTS
+    html_content = b"".join(
+        (
+            template_prefix,
+            _REPLACEMENT_START,
+            solution_json,
+            _REPLACEMENT_END,
+            template_suffix,
+        )
+    )
+
+    logger.info(f"Generated HTML with template, final size: {len(html_content)} bytes")
     return html_content
 
 
 def generate_simple_html_report(solution_data):
     """Generate a simple HTML report if template is not available"""
-    import json
-
     html = f"""
     <!DOCTYPE html>
     <html lang="ja">
@@ -729,7 +840,7 @@ def generate_simple_html_report(solution_data):
         <div class="container">
             <h1>シフト表レポート</h1>
             <div class="data">
-                <pre>{json.dumps(solution_data, ensure_ascii=False, indent=2)}</pre>
+                <pre>{orjson.dumps(solution_data, option=orjson.OPT_INDENT_2).decode()}</pre>
             </div>
         </div>
     </body>
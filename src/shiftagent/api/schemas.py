@@ -5,10 +5,15 @@ API request/response schemas using Pydantic
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class EmployeeRequest(BaseModel):
+class _BaseSchema(BaseModel):
+    # Build validators and serializers on first use rather than at import
+    model_config = ConfigDict(defer_build=True)
+
+
+class EmployeeRequest(_BaseSchema):
     id: str
     name: str
     skills: list[str]
@@ -34,7 +39,7 @@ class EmployeeRequest(BaseModel):
     )
 
 
-class BatchEmployeeRequest(BaseModel):
+class BatchEmployeeRequest(_BaseSchema):
     employees: list[EmployeeRequest] = Field(
         description="List of employees to add to the job"
     )
@@ -44,7 +49,7 @@ class BatchEmployeeRequest(BaseModel):
     )
 
 
-class EmployeeAdditionResult(BaseModel):
+class EmployeeAdditionResult(_BaseSchema):
     employee_id: str
     employee_name: str
     status: str  # SUCCESS, FAILED, SKIPPED
@@ -54,7 +59,7 @@ class EmployeeAdditionResult(BaseModel):
     assigned_shifts: int = 0
 
 
-class BatchEmployeeResponse(BaseModel):
+class BatchEmployeeResponse(_BaseSchema):
     job_id: str
     total_employees: int
     successful_additions: int
@@ -67,7 +72,7 @@ class BatchEmployeeResponse(BaseModel):
     html_report_url: str | None = None
 
 
-class ShiftRequest(BaseModel):
+class ShiftRequest(_BaseSchema):
     id: str
     start_time: datetime
     end_time: datetime
@@ -76,22 +81,22 @@ class ShiftRequest(BaseModel):
     priority: int = 5
 
 
-class ShiftScheduleRequest(BaseModel):
+class ShiftScheduleRequest(_BaseSchema):
     employees: list[EmployeeRequest]
     shifts: list[ShiftRequest]
 
 
-class SolveResponse(BaseModel):
+class SolveResponse(_BaseSchema):
     job_id: str
     status: str
 
 
-class SwapShiftsRequest(BaseModel):
+class SwapShiftsRequest(_BaseSchema):
     shift1_id: str = Field(description="ID of the first shift to swap")
     shift2_id: str = Field(description="ID of the second shift to swap")
 
 
-class SwapShiftsResponse(BaseModel):
+class SwapShiftsResponse(_BaseSchema):
     job_id: str
     shift1_id: str
     shift2_id: str
@@ -101,7 +106,7 @@ class SwapShiftsResponse(BaseModel):
     html_report_url: str | None = None
 
 
-class ReassignShiftRequest(BaseModel):
+class ReassignShiftRequest(_BaseSchema):
     shift_id: str = Field(description="ID of the shift to reassign")
     employee_id: str | None = Field(
         description="ID of the employee to assign (null to unassign)"
@@ -111,7 +116,7 @@ class ReassignShiftRequest(BaseModel):
     )
 
 
-class ReassignShiftResponse(BaseModel):
+class ReassignShiftResponse(_BaseSchema):
     job_id: str
     shift_id: str
     employee_id: str | None
@@ -123,7 +128,7 @@ class ReassignShiftResponse(BaseModel):
     html_report_url: str | None = None
 
 
-class SolutionResponse(BaseModel):
+class SolutionResponse(_BaseSchema):
     job_id: str
     status: str
     solution: dict[str, Any] | None = None
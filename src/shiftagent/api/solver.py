@@ -4,8 +4,12 @@ Timefold Solver configuration and factory
 
 import logging
 import os
+import queue
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
-from timefold.solver import SolverFactory
+from timefold.solver import Solver, SolverFactory
 from timefold.solver.config import (
     Duration,
     ScoreDirectorFactoryConfig,
@@ -25,6 +29,7 @@ SOLVER_TIMEOUT_SECONDS = int(
     os.getenv("SOLVER_TIMEOUT_SECONDS", "120")
 )  # Default: 2 minutes
 SOLVER_LOG_LEVEL = os.getenv("SOLVER_LOG_LEVEL", "INFO")  # INFO or DEBUG
+SOLVER_WORKERS = int(os.getenv("SOLVER_WORKERS", "2"))  # Concurrent request solves
 
 
 # Configure Timefold logging based on environment
@@ -77,3 +82,27 @@ solver_config = SolverConfig(
 # Note: Solver internal logging is controlled via Python logging configuration above
 
 solver_factory = SolverFactory.create(solver_config)
+
+# Idle solvers kept for reuse; the configuration is fixed, so any solver will do
+_solver_pool: queue.SimpleQueue[Solver] = queue.SimpleQueue()
+
+
+@contextmanager
+def pooled_solver() -> Iterator[Solver]:
+    """Borrow a solver from the pool, building a new one when none is idle"""
+    try:
+        solver = _solver_pool.get_nowait()
+    except queue.Empty:
+        solver = solver_factory.build_solver()
+
+    yield solver
+
+    # Only solvers that finished cleanly are returned to the pool
+    _solver_pool.put(solver)
+
+
+# Runs solves on behalf of request handlers so they never block the event loop,
+# capped so concurrent solves cannot exhaust the server's shared threadpool
+SOLVER_POOL = ThreadPoolExecutor(
+    max_workers=SOLVER_WORKERS, thread_name_prefix="solver"
+)
@@ -2,11 +2,16 @@
 Storage configuration management for Azure integration
 """
 
+import functools
+import logging
 import os
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 
 class StorageType(Enum):
     """Supported storage types"""
@@ -15,7 +20,10 @@ class StorageType(Enum):
     AZURE = "azure"
 
 
-@dataclass
+_STORAGE_BY_NAME = {storage_type.value: storage_type for storage_type in StorageType}
+
+
+@dataclass(frozen=True, slots=True)
 class StorageConfig:
     """Storage configuration container"""
 
@@ -30,15 +38,15 @@ class StorageConfigManager:
     """Manager for storage configuration"""
 
     @staticmethod
+    @functools.cache
     def from_environment() -> StorageConfig:
-        """Create storage config from environment variables"""
+        """Create storage config from environment variables, once per process"""
         storage_type_str = os.getenv("JOB_STORAGE_TYPE", "filesystem").lower()
 
-        try:
-            storage_type = StorageType(storage_type_str)
-        except ValueError:
-            print(
-                f"Warning: Unknown storage type '{storage_type_str}', defaulting to filesystem"
+        storage_type = _STORAGE_BY_NAME.get(storage_type_str)
+        if storage_type is None:
+            logger.warning(
+                "Unknown storage type '%s', defaulting to filesystem", storage_type_str
             )
             storage_type = StorageType.FILESYSTEM
 
@@ -105,36 +113,38 @@ class StorageConfigManager:
         """Apply configuration to current environment"""
         env_vars = StorageConfigManager.get_environment_variables(config)
         os.environ.update(env_vars)
+        # The environment changed, so the cached config is stale
+        StorageConfigManager.from_environment.cache_clear()
 
     @staticmethod
     def create_env_file(config: StorageConfig, file_path: str = ".env") -> None:
         """Create .env file with storage configuration"""
         env_vars = StorageConfigManager.get_environment_variables(config)
 
-        with open(file_path, "w") as f:
-            f.write("# Storage Configuration\n")
-            for key, value in env_vars.items():
-                f.write(f"{key}={value}\n")
+        body = "# Storage Configuration\n" + "".join(
+            f"{key}={value}\n" for key, value in env_vars.items()
+        )
+        Path(file_path).write_text(body, encoding="utf-8")
 
     @staticmethod
     def print_config_info(config: StorageConfig) -> None:
-        """Print configuration information"""
-        print(f"Storage Type: {config.storage_type.value}")
+        """Log configuration information"""
+        logger.info("Storage Type: %s", config.storage_type.value)
 
         if config.storage_type == StorageType.FILESYSTEM:
-            print(f"Storage Directory: {config.filesystem_dir}")
+            logger.info("Storage Directory: %s", config.filesystem_dir)
 
         elif config.storage_type == StorageType.AZURE:
-            print(f"Container Name: {config.azure_container_name}")
+            logger.info("Container Name: %s", config.azure_container_name)
             if config.azure_account_name:
-                print(f"Account Name: {config.azure_account_name}")
+                logger.info("Account Name: %s", config.azure_account_name)
             if config.azure_connection_string:
-                print("Connection String: [CONFIGURED]")
+                logger.info("Connection String: [CONFIGURED]")
             else:
-                print("Connection String: [NOT SET]")
+                logger.info("Connection String: [NOT SET]")
 
         is_valid = StorageConfigManager.validate_config(config)
-        print(f"Configuration Valid: {is_valid}")
+        logger.info("Configuration Valid: %s", is_valid)
 
 
 def get_current_storage_config() -> StorageConfig:
@@ -148,7 +158,7 @@ def setup_azure_storage_from_terraform(terraform_outputs: dict[str, Any]) -> Non
 
     if StorageConfigManager.validate_config(config):
         StorageConfigManager.apply_to_environment(config)
-        print("Azure storage configuration applied to environment")
+        logger.info("Azure storage configuration applied to environment")
         StorageConfigManager.print_config_info(config)
     else:
-        print("Warning: Invalid Azure storage configuration from Terraform outputs")
+        logger.warning("Invalid Azure storage configuration from Terraform outputs")
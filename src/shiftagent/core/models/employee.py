@@ -12,7 +12,7 @@ class Employee:
 
     id: str
     name: str
-    skills: set[str] = field(default_factory=set)
+    skills: frozenset[str] = field(default_factory=frozenset)
     # Employee preference fields
     preferred_days_off: set[str] = field(
         default_factory=set
@@ -27,11 +27,17 @@ class Employee:
     is_emergency_addition: bool = field(default=False)
     emergency_added_at: datetime | None = field(default=None)
 
+    def __post_init__(self):
+        # Keep skills immutable so subset checks against shifts' frozensets
+        # compare two frozensets without building a temporary set
+        if not isinstance(self.skills, frozenset):
+            self.skills = frozenset(self.skills)
+
     def has_skill(self, skill: str) -> bool:
         """Check if employee has the specified skill"""
         return skill in self.skills
 
-    def has_all_skills(self, required_skills: set[str]) -> bool:
+    def has_all_skills(self, required_skills: frozenset[str]) -> bool:
         """Check if employee has all required skills"""
         return required_skills.issubset(self.skills)
 
@@ -81,7 +87,7 @@ class Employee:
         self.is_emergency_addition = True
         self.emergency_added_at = datetime.now()
 
-    def has_required_skills(self, required_skills: set[str]) -> bool:
+    def has_required_skills(self, required_skills: frozenset[str]) -> bool:
         """Check if employee has all required skills"""
         return required_skills.issubset(self.skills)
 
@@ -48,11 +48,16 @@ class ShiftSchedule:
 
     def get_assigned_shift_count(self) -> int:
         """Get the number of assigned shifts"""
-        return sum(1 for shift in self.shifts if shift.is_assigned())
+        return sum(1 for shift in self.shifts if shift.employee is not None)
 
     def get_unassigned_shift_count(self) -> int:
         """Get the number of unassigned shifts"""
-        return self.get_shift_count() - self.get_assigned_shift_count()
+        return self.get_assignment_counts()[1]
+
+    def get_assignment_counts(self) -> tuple[int, int]:
+        """Get the numbers of assigned and unassigned shifts in one pass"""
+        assigned = self.get_assigned_shift_count()
+        return assigned, len(self.shifts) - assigned
 
     def add_employee(self, employee: Employee):
         """Add an employee"""
@@ -2,14 +2,34 @@
 Shift domain model
 """
 
+import functools
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Annotated
 
 from timefold.solver.domain import PlanningPin, PlanningVariable, planning_entity
 
 from .employee import Employee
 
+_ONE_MINUTE = timedelta(minutes=1)
+
+# Number of distinct skill sets kept for sharing; least recently used sets are
+# dropped first, so skill sets sent to the API do not accumulate forever
+SKILL_INTERN_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=SKILL_INTERN_CACHE_SIZE)
+def _shared_skills(skills: frozenset[str]) -> frozenset[str]:
+    """Return the first cached frozenset equal to the given skills"""
+    return skills
+
+
+def _intern_skills(skills: Iterable[str]) -> frozenset[str]:
+    """Return a shared frozenset equal to the given skills"""
+    key = skills if isinstance(skills, frozenset) else frozenset(skills)
+    return _shared_skills(key)
+
 
 @planning_entity
 @dataclass
@@ -19,7 +39,7 @@ class Shift:
     id: str
     start_time: datetime
     end_time: datetime
-    required_skills: set[str] = field(default_factory=set)
+    required_skills: frozenset[str] = field(default_factory=frozenset)
     location: str | None = None
     priority: int = 5  # 1 is highest priority, 10 is lowest priority
 
@@ -30,9 +50,14 @@ class Shift:
     # When pinned is True, Timefold will not change the employee assignment
     pinned: Annotated[bool, PlanningPin] = field(default=False)
 
+    def __post_init__(self):
+        # Keep required skills immutable and shared so skill checks reuse one set
+        self.required_skills = _intern_skills(self.required_skills)
+
     def get_duration_minutes(self) -> int:
         """Get the duration of the shift in minutes"""
-        return int((self.end_time - self.start_time).total_seconds() / 60)
+        # Integer division of timedeltas yields an int without a float round trip
+        return (self.end_time - self.start_time) // _ONE_MINUTE
 
     def overlaps_with(self, other: "Shift") -> bool:
         """Check if this shift overlaps with another shift"""
@@ -58,13 +83,11 @@ class Shift:
 
     def __str__(self):
         employee_name = (
-            self.employee.name
-            if self.employee is not None and hasattr(self.employee, "name")
-            else "Unassigned"
+            self.employee.name if self.employee is not None else "Unassigned"
         )
         return (
             f"Shift(id='{self.id}', "
-            f"start={self.start_time.strftime('%Y-%m-%d %H:%M')}, "
-            f"end={self.end_time.strftime('%Y-%m-%d %H:%M')}, "
+            f"start={self.start_time:%Y-%m-%d %H:%M}, "
+            f"end={self.end_time:%Y-%m-%d %H:%M}, "
             f"skills={self.required_skills}, employee='{employee_name}')"
         )
@@ -2,14 +2,128 @@
 Demo data generation for testing - Logistics Warehouse
 """
 
+import functools
+from copy import deepcopy
 from datetime import datetime, timedelta
 
 from ..core.models import Employee, Shift, ShiftSchedule
 
-
-def get_next_monday() -> datetime:
-    """Get the next Monday from today (or today if it's Monday)"""
-    today = datetime.now()
+_DAY_NAMES = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+_DAY_OFFSETS = tuple(timedelta(days=day) for day in range(len(_DAY_NAMES)))
+
+# Daily shift templates: (id prefix, start hour, end hour, end minute,
+# required skills, location, priority, days of the week it runs on)
+_SHIFT_TEMPLATES = (
+    # Early morning receiving work (6:00-14:00) - 8 hours, high priority
+    (
+        "入庫",
+        6,
+        14,
+        0,
+        frozenset({"入庫管理", "フォークリフト"}),
+        "入庫エリア",
+        1,
+        range(7),
+    ),
+    # Morning picking work (8:00-16:00) - 8 hours
+    (
+        "ピッキング午前",
+        8,
+        16,
+        0,
+        frozenset({"ピッキング"}),
+        "ピッキングエリア",
+        2,
+        range(7),
+    ),
+    # Afternoon picking and packaging work (14:00-22:00) - 8 hours
+    (
+        "ピッキング午後",
+        14,
+        22,
+        0,
+        frozenset({"ピッキング", "梱包"}),
+        "ピッキングエリア",
+        2,
+        range(7),
+    ),
+    # Shipping work (16:00-24:00) - 8 hours, high priority, except Sunday
+    (
+        "出荷",
+        16,
+        23,
+        59,
+        frozenset({"出荷管理", "フォークリフト"}),
+        "出荷エリア",
+        1,
+        range(6),
+    ),
+    # Inspection work (for part-time workers) (9:00-13:00) - 4 hours, weekdays only
+    (
+        "検品午前",
+        9,
+        13,
+        0,
+        frozenset({"検品"}),
+        "検品エリア",
+        3,
+        range(5),
+    ),
+    # Inventory management work (for part-time workers) (13:00-17:00) - 4 hours,
+    # weekdays only
+    (
+        "在庫管理",
+        13,
+        17,
+        0,
+        frozenset({"在庫管理"}),
+        "在庫管理エリア",
+        4,
+        range(5),
+    ),
+    # Administrative work (9:00-18:00) - 9 hours, weekdays only
+    (
+        "事務作業",
+        9,
+        18,
+        0,
+        frozenset({"正社員"}),
+        "事務所",
+        1,
+        range(5),
+    ),
+    # Special Saturday shift (for busy periods)
+    (
+        "土曜特別",
+        10,
+        18,
+        0,
+        frozenset({"ピッキング", "梱包"}),
+        "ピッキングエリア",
+        3,
+        (5,),
+    ),
+)
+
+# Distinct (hour, minute) times at which the shift templates start or end
+_SHIFT_TIMES = frozenset(
+    time
+    for _, start_hour, end_hour, end_minute, *_ in _SHIFT_TEMPLATES
+    for time in ((start_hour, 0), (end_hour, end_minute))
+)
+
+
+def get_next_monday(reference: datetime | None = None) -> datetime:
+    """Get the next Monday from reference, default now (or that day if it's Monday)"""
+    today = reference or datetime.now()
     days_until_monday = (7 - today.weekday()) % 7
 
     # If it's Monday and already past 6 PM, use next Monday instead
@@ -21,11 +135,18 @@ def get_next_monday() -> datetime:
     return next_monday.replace(hour=9, minute=0, second=0, microsecond=0)
 
 
-def create_demo_schedule() -> ShiftSchedule:
+def create_demo_schedule(shared: bool = False) -> ShiftSchedule:
     """Create a logistics warehouse shift schedule"""
-    # Get next Monday as the start date for demo data
-    monday = get_next_monday()
-    friday_date = monday + timedelta(days=4)
+    # Get next Monday as the start date for demo data; the schedule is built
+    # once per start date, and only read-only callers get the shared instance
+    schedule = _build_demo_schedule(get_next_monday())
+    return schedule if shared else deepcopy(schedule)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_demo_schedule(monday: datetime) -> ShiftSchedule:
+    """Build the demo schedule for the week starting on the given Monday"""
+    friday_date = monday + _DAY_OFFSETS[4]
 
     # Create warehouse workers (including employment type and preferences)
     employees = [
@@ -85,128 +206,36 @@ def create_demo_schedule() -> ShiftSchedule:
 
     # Create shifts for one week (considering weekly work hours)
     # Starting from Monday
-
-    shifts = []
-
-    for day in range(7):  # One week
-        day_start = monday + timedelta(days=day)
-        day_name = [
-            "monday",
-            "tuesday",
-            "wednesday",
-            "thursday",
-            "friday",
-            "saturday",
-            "sunday",
-        ][day]
-        # day_name_jp = [
-        #     "月曜",
-        #     "火曜",
-        #     "水曜",
-        #     "木曜",
-        #     "金曜",
-        #     "土曜",
-        #     "日曜",
-        # ][day]  # Unused variable, kept for reference
-
-        # Early morning receiving work (6:00-14:00) - 8 hours
-        shifts.append(
-            Shift(
-                id=f"入庫_{day_name}",
-                start_time=day_start.replace(hour=6),
-                end_time=day_start.replace(hour=14),
-                required_skills={"入庫管理", "フォークリフト"},
-                location="入庫エリア",
-                priority=1,  # High priority
-            )
-        )
-
-        # Morning picking work (8:00-16:00) - 8 hours
-        shifts.append(
-            Shift(
-                id=f"ピッキング午前_{day_name}",
-                start_time=day_start.replace(hour=8),
-                end_time=day_start.replace(hour=16),
-                required_skills={"ピッキング"},
-                location="ピッキングエリア",
-                priority=2,
-            )
-        )
-
-        # Afternoon picking and packaging work (14:00-22:00) - 8 hours
-        shifts.append(
-            Shift(
-                id=f"ピッキング午後_{day_name}",
-                start_time=day_start.replace(hour=14),
-                end_time=day_start.replace(hour=22),
-                required_skills={"ピッキング", "梱包"},
-                location="ピッキングエリア",
-                priority=2,
-            )
+    # Every shift boundary time of each day, built once and shared by its shifts
+    day_times = []
+    for day, offset in enumerate(_DAY_OFFSETS):
+        day_start = monday + offset
+        times = {
+            (hour, minute): day_start.replace(hour=hour, minute=minute)
+            for hour, minute in _SHIFT_TIMES
+        }
+        day_times.append((day, times))
+    shifts = [
+        Shift(
+            id=f"{prefix}_{_DAY_NAMES[day]}",
+            start_time=times[start_hour, 0],
+            end_time=times[end_hour, end_minute],
+            required_skills=required_skills,
+            location=location,
+            priority=priority,
         )
-
-        # Shipping work (16:00-24:00) - 8 hours
-        if day < 6:  # Except Sunday
-            shifts.append(
-                Shift(
-                    id=f"出荷_{day_name}",
-                    start_time=day_start.replace(hour=16),
-                    end_time=day_start.replace(hour=23, minute=59),
-                    required_skills={"出荷管理", "フォークリフト"},
-                    location="出荷エリア",
-                    priority=1,  # High priority
-                )
-            )
-
-        # Inspection work (for part-time workers) (9:00-13:00) - 4 hours
-        if day < 5:  # Weekdays only
-            shifts.append(
-                Shift(
-                    id=f"検品午前_{day_name}",
-                    start_time=day_start.replace(hour=9),
-                    end_time=day_start.replace(hour=13),
-                    required_skills={"検品"},
-                    location="検品エリア",
-                    priority=3,
-                )
-            )
-
-            # Inventory management work (for part-time workers) (13:00-17:00) - 4 hours
-            shifts.append(
-                Shift(
-                    id=f"在庫管理_{day_name}",
-                    start_time=day_start.replace(hour=13),
-                    end_time=day_start.replace(hour=17),
-                    required_skills={"在庫管理"},
-                    location="在庫管理エリア",
-                    priority=4,
-                )
-            )
-
-        # Administrative work (weekdays only) (9:00-18:00) - 9 hours
-        if day < 5:  # Weekdays only
-            shifts.append(
-                Shift(
-                    id=f"事務作業_{day_name}",
-                    start_time=day_start.replace(hour=9),
-                    end_time=day_start.replace(hour=18),
-                    required_skills={"正社員"},
-                    location="事務所",
-                    priority=1,
-                )
-            )
-
-        # Special Saturday shift (for busy periods)
-        if day == 5:  # Saturday
-            shifts.append(
-                Shift(
-                    id=f"土曜特別_{day_name}",
-                    start_time=day_start.replace(hour=10),
-                    end_time=day_start.replace(hour=18),
-                    required_skills={"ピッキング", "梱包"},
-                    location="ピッキングエリア",
-                    priority=3,
-                )
-            )
+        for day, times in day_times
+        for (
+            prefix,
+            start_hour,
+            end_hour,
+            end_minute,
+            required_skills,
+            location,
+            priority,
+            days,
+        ) in _SHIFT_TEMPLATES
+        if day in days
+    ]
 
     return ShiftSchedule(employees=employees, shifts=shifts)
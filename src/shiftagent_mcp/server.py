@@ -5,12 +5,15 @@ FastMCP server for ShiftAgent
 import logging
 import os
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
 
 from .tools import (
     add_employee_to_job,
     analyze_weekly_hours,
+    close_client,
     get_demo_schedule,
     get_schedule_html_report,
     get_schedule_shifts,
@@ -22,6 +25,7 @@ from .tools import (
     swap_shifts,
     test_weekly_constraints,
     update_employee_skills,
+    wait_for_completion,
 )
 
 # Ensure all logging goes to stderr, as stdout is used for MCP communication.
@@ -29,7 +33,20 @@ logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), stream=sys.std
 
 # Create FastMCP server with logging
 logger = logging.getLogger(__name__)
-mcp: FastMCP = FastMCP("shiftagent-mcp", dependencies=["httpx"])
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared API client when the server shuts down"""
+    try:
+        yield
+    finally:
+        await close_client()
+
+
+mcp: FastMCP = FastMCP(
+    "shiftagent-mcp", dependencies=["httpx[http2]"], lifespan=lifespan
+)
 
 # Configure logging for fastmcp specifically if needed
 mcp_log_level = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
@@ -41,6 +58,7 @@ mcp.tool()(get_demo_schedule)
 mcp.tool()(solve_schedule_sync)
 mcp.tool()(solve_schedule_async)
 mcp.tool()(get_solve_status)
+mcp.tool()(wait_for_completion)
 mcp.tool()(analyze_weekly_hours)
 mcp.tool()(test_weekly_constraints)
 
@@ -90,6 +108,7 @@ async def shift_scheduling_prompt() -> str:
 - solve_schedule_sync: Full schedule optimization (blocking)
 - solve_schedule_async: Start full optimization job
 - get_solve_status: Check job status and get results
+- wait_for_completion: Wait for an async job to finish and get results
 - analyze_weekly_hours: Analyze hours and violations
 - test_weekly_constraints: Test with demo data
 
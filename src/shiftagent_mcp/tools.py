@@ -2,18 +2,50 @@
 MCP tools for ShiftAgent operations
 """
 
-import json
 import os
 from datetime import datetime
 from typing import Any
 
 import httpx
+import orjson
 from fastmcp import Context
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 # Configuration
 API_BASE_URL = os.getenv("SHIFTAGENT_API_URL", "http://localhost:8081")
 
+# Content type sent with pre-encoded JSON request bodies
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Decodes API responses straight from the body bytes in a single pass
+_RESPONSE_ADAPTER = TypeAdapter(dict[str, Any])
+
+# Shared API client, so tool calls reuse pooled keep-alive connections. HTTP/2 is
+# negotiated over TLS where the API supports it, multiplexing concurrent calls
+# over one connection; plain http:// URLs keep using HTTP/1.1
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared API client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            http2=True,
+            timeout=httpx.Timeout(120.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared API client and its pooled connections"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 # Helper functions
 def parse_list_param(param: None | str | list[str]) -> list[str]:
@@ -21,15 +53,18 @@ def parse_list_param(param: None | str | list[str]) -> list[str]:
     if param is None:
         return []
     if isinstance(param, str):
+        # Only a JSON array yields a list; anything else is a single item
+        if not param.lstrip().startswith("["):
+            return [param]
         try:
-            parsed = json.loads(param)
+            parsed = orjson.loads(param)
             # Ensure the parsed value is a list
             if isinstance(parsed, list):
                 return parsed
             else:
                 # If it's not a list after parsing, treat original as single item
                 return [param]
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # If it's not valid JSON, treat as single item list
             return [param]
     return param
@@ -48,7 +83,7 @@ class EmployeeRequest(BaseModel):
         default_factory=list,
         description="Days employee prefers to work (e.g., ['sunday', 'monday'])",
     )
-    unavailable_dates: list[str] = Field(
+    unavailable_dates: list[datetime] = Field(
         default_factory=list,
         description="Specific dates when employee is unavailable. Format: ISO 8601 (YYYY-MM-DDTHH:MM:SS or YYYY-MM-DD). Examples: '2024-01-15T00:00:00', '2024-01-15'. Time component is optional and will be normalized to date-only for comparison.",
     )
@@ -56,8 +91,8 @@ class EmployeeRequest(BaseModel):
 
 class ShiftRequest(BaseModel):
     id: str
-    start_time: str
-    end_time: str
+    start_time: datetime
+    end_time: datetime
     required_skills: list[str]
     location: str | None = None
     priority: int = Field(default=5, ge=1, le=10)
@@ -68,29 +103,59 @@ class ScheduleRequest(BaseModel):
     shifts: list[ShiftRequest]
 
 
+def _build_schedule_body(
+    employees: list[EmployeeRequest], shifts: list[ShiftRequest]
+) -> bytes:
+    """Encode validated tool arguments as a schedule request body"""
+    # The arguments are already validated, so wrap them without revalidating
+    # and encode in one pass; datetimes are emitted as ISO 8601 strings
+    request = ScheduleRequest.model_construct(employees=employees, shifts=shifts)
+    return request.model_dump_json().encode()
+
+
 # Helper function to make API calls
 async def call_api(
     method: str,
     endpoint: str,
-    data: dict[str, Any] | None = None,
+    data: Any = None,
     timeout: float = 120.0,
+    content: bytes | None = None,
 ) -> dict[str, Any]:
-    """Make an API call to the ShiftAgent"""
-    url = f"{API_BASE_URL}{endpoint}"
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        if method == "GET":
-            response = await client.get(url)
-        elif method == "POST":
-            response = await client.post(url, json=data)
-        elif method == "PATCH":
-            response = await client.patch(url, json=data)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+    """Make an API call to the ShiftAgent, sending data or a pre-encoded JSON body"""
+    client = get_client()
+
+    if method == "GET":
+        response = await client.get(endpoint, timeout=timeout)
+    elif method == "POST" and content is not None:
+        response = await client.post(
+            endpoint, content=content, headers=_JSON_HEADERS, timeout=timeout
+        )
+    elif method == "POST":
+        response = await client.post(endpoint, json=data, timeout=timeout)
+    elif method == "PATCH":
+        response = await client.patch(endpoint, json=data, timeout=timeout)
+    else:
+        raise ValueError(f"Unsupported HTTP method: {method}")
 
-        response.raise_for_status()
-        result: dict[str, Any] = response.json()
-        return result
+    response.raise_for_status()
+    return _RESPONSE_ADAPTER.validate_json(response.content)
+
+
+def _attach_html_message(result: dict[str, Any], headline: str) -> None:
+    """Add a user-friendly message linking to the result's HTML report"""
+    url = result.get("html_report_url")
+    if url:
+        result["html_report_message"] = (
+            f"✨ {headline}! View the formatted HTML report at: {API_BASE_URL}{url}"
+        )
+
+
+async def _post_schedule(
+    endpoint: str, employees: list[EmployeeRequest], shifts: list[ShiftRequest]
+) -> dict[str, Any]:
+    """POST employees and shifts as a schedule request to the ShiftAgent"""
+    body = _build_schedule_body(employees, shifts)
+    return await call_api("POST", endpoint, content=body)
 
 
 # Tool functions
@@ -117,25 +182,9 @@ async def solve_schedule_sync(
     Returns:
         Optimized schedule with assignments
     """
-    request_data = {
-        "employees": [emp.model_dump() for emp in employees],
-        "shifts": [shift.model_dump() for shift in shifts],
-    }
-
-    # Parse datetime strings to ensure they're in ISO format
-    for shift in request_data["shifts"]:
-        shift["start_time"] = datetime.fromisoformat(shift["start_time"]).isoformat()
-        shift["end_time"] = datetime.fromisoformat(shift["end_time"]).isoformat()
-
-    result = await call_api("POST", "/api/shifts/solve-sync", request_data)
-
-    # Add user-friendly message about HTML report
-    if result.get("html_report_url"):
-        result["html_report_message"] = (
-            f"✨ Schedule optimized! View the formatted HTML report at: "
-            f"http://localhost:8081{result['html_report_url']}"
-        )
+    result = await _post_schedule("/api/shifts/solve-sync", employees, shifts)
 
+    _attach_html_message(result, "Schedule optimized")
     return result
 
 
@@ -152,17 +201,7 @@ async def solve_schedule_async(
     Returns:
         Job ID and status for tracking the optimization
     """
-    request_data = {
-        "employees": [emp.model_dump() for emp in employees],
-        "shifts": [shift.model_dump() for shift in shifts],
-    }
-
-    # Parse datetime strings to ensure they're in ISO format
-    for shift in request_data["shifts"]:
-        shift["start_time"] = datetime.fromisoformat(shift["start_time"]).isoformat()
-        shift["end_time"] = datetime.fromisoformat(shift["end_time"]).isoformat()
-
-    return await call_api("POST", "/api/shifts/solve", request_data)
+    return await _post_schedule("/api/shifts/solve", employees, shifts)
 
 
 async def get_solve_status(ctx: Context, job_id: str) -> dict[str, Any]:
@@ -177,13 +216,33 @@ async def get_solve_status(ctx: Context, job_id: str) -> dict[str, Any]:
     """
     result = await call_api("GET", f"/api/shifts/solve/{job_id}")
 
-    # Add a user-friendly message about the HTML report if job is completed
-    if result.get("status") == "SOLVING_COMPLETED" and result.get("html_report_url"):
-        result["html_report_message"] = (
-            f"✨ Schedule completed! View the formatted HTML report at: "
-            f"http://localhost:8081{result['html_report_url']}"
-        )
+    if result.get("status") == "SOLVING_COMPLETED":
+        _attach_html_message(result, "Schedule completed")
+    return result
+
+
+async def wait_for_completion(
+    ctx: Context, job_id: str, timeout: float = 30.0
+) -> dict[str, Any]:
+    """
+    Wait for an async solve job to finish instead of polling its status
+
+    Args:
+        job_id: The job ID returned by solve_schedule_async
+        timeout: Maximum seconds to wait (the server caps this)
 
+    Returns:
+        Job status and solution (still in progress if the timeout elapsed)
+    """
+    result = await call_api(
+        "GET",
+        f"/api/shifts/solve/{job_id}/wait?timeout={timeout}",
+        # Leave headroom for the server to answer once the wait elapses
+        timeout=timeout + 30.0,
+    )
+
+    if result.get("status") == "SOLVING_COMPLETED":
+        _attach_html_message(result, "Schedule completed")
     return result
 
 
@@ -200,17 +259,7 @@ async def analyze_weekly_hours(
     Returns:
         Detailed analysis of weekly hours, violations, and recommendations
     """
-    request_data = {
-        "employees": [emp.model_dump() for emp in employees],
-        "shifts": [shift.model_dump() for shift in shifts],
-    }
-
-    # Parse datetime strings to ensure they're in ISO format
-    for shift in request_data["shifts"]:
-        shift["start_time"] = datetime.fromisoformat(shift["start_time"]).isoformat()
-        shift["end_time"] = datetime.fromisoformat(shift["end_time"]).isoformat()
-
-    return await call_api("POST", "/api/shifts/analyze-weekly", request_data)
+    return await _post_schedule("/api/shifts/analyze-weekly", employees, shifts)
 
 
 async def test_weekly_constraints(ctx: Context) -> dict[str, Any]:
@@ -248,16 +297,8 @@ async def add_employee_to_job(
     Returns:
         Success message with updated job status and statistics
     """
-    employee_data = employee.model_dump()
-
-    # Ensure dates are in ISO format
-    if employee_data.get("unavailable_dates"):
-        employee_data["unavailable_dates"] = [
-            datetime.fromisoformat(date).isoformat()
-            if isinstance(date, str)
-            else date.isoformat()
-            for date in employee_data["unavailable_dates"]
-        ]
+    # Dates are emitted as ISO 8601 strings
+    employee_data = employee.model_dump(mode="json")
 
     return await call_api("POST", f"/api/shifts/{job_id}/add-employee", employee_data)
 
@@ -282,14 +323,10 @@ async def update_employee_skills(
     # Parse skills parameter to ensure it's a list
     parsed_skills = parse_list_param(skills)
 
-    # Make direct PATCH request with list body
-    url = f"{API_BASE_URL}/api/shifts/{job_id}/employee/{employee_id}/skills"
+    # The endpoint takes the skill list itself as the request body
+    endpoint = f"/api/shifts/{job_id}/employee/{employee_id}/skills"
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        response = await client.patch(url, json=parsed_skills)
-        response.raise_for_status()
-        result: dict[str, Any] = response.json()
-        return result
+    return await call_api("PATCH", endpoint, parsed_skills)
 
 
 async def get_schedule_html_report(ctx: Context, job_id: str) -> dict[str, Any]:
@@ -308,20 +345,17 @@ async def get_schedule_html_report(ctx: Context, job_id: str) -> dict[str, Any]:
     """
     try:
         # Get HTML content from API
-        url = f"{API_BASE_URL}/api/shifts/solve/{job_id}/html"
-
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            html_content = response.text
-
-            return {
-                "html_content": html_content,
-                "content_type": "text/html",
-                "job_id": job_id,
-                "generated_at": datetime.now().isoformat(),
-                "message": "HTML report generated successfully. You can save this to a file and open in a browser.",
-            }
+        response = await get_client().get(f"/api/shifts/solve/{job_id}/html")
+        response.raise_for_status()
+        html_content = response.text
+
+        return {
+            "html_content": html_content,
+            "content_type": "text/html",
+            "job_id": job_id,
+            "generated_at": datetime.now().isoformat(),
+            "message": "HTML report generated successfully. You can save this to a file and open in a browser.",
+        }
 
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
@@ -0,0 +1,65 @@
+"""
+Shared test fixtures
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.shiftagent.api import jobs as jobs_module
+from src.shiftagent.api.jobs import (
+    flush_job_syncs,
+    job_lock,
+    register_job,
+    remove_job,
+    unindex_job,
+)
+
+
+@pytest.fixture
+def make_job():
+    """Register in-memory jobs, removing them again after the test"""
+    created: list[str] = []
+
+    def make(status: str, **fields) -> str:
+        job_id = str(uuid.uuid4())
+        with job_lock:
+            register_job(
+                job_id, {"status": status, "created_at": datetime.now(), **fields}
+            )
+        created.append(job_id)
+        return job_id
+
+    yield make
+
+    with job_lock:
+        for job_id in created:
+            remove_job(job_id)
+            unindex_job(job_id)
+
+
+class RecordingJobStore:
+    """Job store that keeps saved jobs in memory and counts the writes"""
+
+    def __init__(self):
+        self.saved: dict[str, dict] = {}
+        self.writes: list[str] = []
+
+    def save_job(self, job_id: str, job_data: dict) -> None:
+        self.saved[job_id] = job_data
+        self.writes.append(job_id)
+
+    def delete_job(self, job_id: str) -> None:
+        self.saved.pop(job_id, None)
+
+
+@pytest.fixture
+def recording_store(monkeypatch):
+    """Route job store writes to an in-memory recording store"""
+    # Write out anything queued by earlier tests before swapping the store
+    flush_job_syncs()
+    store = RecordingJobStore()
+    monkeypatch.setattr(jobs_module, "job_store", store)
+    yield store
+    flush_job_syncs()
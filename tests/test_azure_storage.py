@@ -99,6 +99,48 @@ class TestAzureBlobJobStore:
         assert retrieved_job["job_id"] == job_id
         assert retrieved_job["status"] == "completed"
 
+    def test_save_and_get_updated_at(self, job_store, mock_blob_service_client):
+        """Test that a job's last update time survives a save and reload"""
+        mock_blob_client = Mock()
+        mock_blob_service_client.get_blob_client.return_value = mock_blob_client
+        updated_at = datetime(2024, 1, 1, 10, 30)
+
+        job_store.save_job(
+            "job1", {"status": "SOLVING_COMPLETED", "updated_at": updated_at}
+        )
+
+        uploaded = mock_blob_client.upload_blob.call_args.args[0]
+        mock_blob_data = Mock()
+        mock_blob_data.readall.return_value = uploaded.encode("utf-8")
+        mock_blob_client.download_blob.return_value = mock_blob_data
+
+        assert job_store.get_job("job1")["updated_at"] == updated_at
+
+    def test_get_many(self, job_store, mock_blob_service_client):
+        """Test retrieving several jobs at once"""
+        from azure.core.exceptions import ResourceNotFoundError
+
+        def get_blob_client(container, blob):
+            mock_blob_client = Mock()
+            if blob == "jobs/missing.json":
+                mock_blob_client.download_blob.side_effect = ResourceNotFoundError()
+            else:
+                job_id = blob[5:-5]
+                mock_blob_data = Mock()
+                mock_blob_data.readall.return_value = (
+                    f'{{"job_id": "{job_id}", "status": "completed"}}'.encode()
+                )
+                mock_blob_client.download_blob.return_value = mock_blob_data
+            return mock_blob_client
+
+        mock_blob_service_client.get_blob_client.side_effect = get_blob_client
+
+        jobs = job_store.get_many(["job1", "missing", "job2"])
+
+        assert set(jobs) == {"job1", "job2"}
+        assert jobs["job1"]["job_id"] == "job1"
+        assert jobs["job2"]["status"] == "completed"
+
     def test_list_jobs(self, job_store, mock_blob_service_client):
         """Test listing jobs"""
         # Mock container client
@@ -120,6 +162,61 @@ class TestAzureBlobJobStore:
         assert "job1" in job_ids
         assert "job2" in job_ids
 
+    def test_iter_job_summaries(self, job_store, mock_blob_service_client):
+        """Test listing job summaries from blob metadata"""
+        mock_container_client = Mock()
+        mock_blob_service_client.get_container_client.return_value = (
+            mock_container_client
+        )
+
+        mock_blob = Mock()
+        mock_blob.name = "jobs/job1.json"
+        mock_blob.metadata = {
+            "job_id": "job1",
+            "status": "SOLVING_COMPLETED",
+            "created_at": "2024-01-01T09:00:00",
+            "completed_at": "",
+        }
+        mock_container_client.list_blobs.return_value = [mock_blob]
+
+        summaries = dict(job_store.iter_job_summaries())
+
+        assert summaries == {
+            "job1": {
+                "status": "SOLVING_COMPLETED",
+                "created_at": datetime(2024, 1, 1, 9, 0),
+                "completed_at": None,
+            }
+        }
+        mock_blob_service_client.get_blob_client.assert_not_called()
+
+    def test_load_stored_jobs(self, job_store, mock_blob_service_client):
+        """Test that only jobs in the requested statuses are downloaded"""
+        mock_container_client = Mock()
+        mock_blob_service_client.get_container_client.return_value = (
+            mock_container_client
+        )
+
+        done_blob = Mock()
+        done_blob.name = "jobs/done.json"
+        done_blob.metadata = {"status": "SOLVING_COMPLETED"}
+        running_blob = Mock()
+        running_blob.name = "jobs/running.json"
+        running_blob.metadata = {"status": "SOLVING_ACTIVE"}
+        mock_container_client.list_blobs.return_value = [done_blob, running_blob]
+
+        done_job = {"status": "SOLVING_COMPLETED"}
+        with patch.object(
+            job_store, "get_many", return_value={"done": done_job}
+        ) as get_many:
+            loaded = {
+                job_id: job
+                for job_id, _, job in job_store.load_stored_jobs({"SOLVING_COMPLETED"})
+            }
+
+        assert list(get_many.call_args.args[0]) == ["done"]
+        assert loaded == {"done": done_job, "running": None}
+
     def test_delete_job(self, job_store, mock_blob_service_client):
         """Test deleting a job"""
         mock_blob_client = Mock()
@@ -162,8 +162,9 @@ def test_add_employee_to_invalid_job():
     new_employee = Employee("emp_test", "Test Employee", {"skill1"})
 
     # Test employee addition (should fail)
-    success = add_employee_to_completed_job(job_id, new_employee)
+    success, error = add_employee_to_completed_job(job_id, new_employee)
     assert success is False
+    assert error == f"Job {job_id} is not completed"
 
 
 def test_add_employee_to_nonexistent_job():
@@ -174,8 +175,9 @@ def test_add_employee_to_nonexistent_job():
     new_employee = Employee("emp_test", "Test Employee", {"skill1"})
 
     # Test adding to nonexistent job
-    success = add_employee_to_completed_job("nonexistent_job_id", new_employee)
+    success, error = add_employee_to_completed_job("nonexistent_job_id", new_employee)
     assert success is False
+    assert error == "Job nonexistent_job_id not found"
 
 
 if __name__ == "__main__":
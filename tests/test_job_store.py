@@ -0,0 +1,121 @@
+"""
+Tests for the filesystem job store
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.shiftagent.api.job_store import FileSystemJobStore
+from src.shiftagent.api.jobs import _solution_etag, solution_etag
+from src.shiftagent.core.models.employee import Employee
+from src.shiftagent.core.models.schedule import ShiftSchedule
+from src.shiftagent.core.models.shift import Shift
+
+
+@pytest.fixture
+def job_store(tmp_path):
+    """Create a filesystem job store in a temporary directory"""
+    return FileSystemJobStore(str(tmp_path))
+
+
+def _completed_job() -> dict:
+    """Build a completed job with a one-shift solution"""
+    employee = Employee("emp1", "John Smith", {"Nurse"})
+    shift = Shift(
+        "shift1",
+        datetime(2025, 6, 2, 9, 0),
+        datetime(2025, 6, 2, 17, 0),
+        {"Nurse"},
+        "Hospital",
+    )
+    shift.employee = employee
+    return {
+        "status": "SOLVING_COMPLETED",
+        "created_at": datetime(2025, 6, 1, 9, 0),
+        "completed_at": datetime(2025, 6, 1, 9, 5),
+        "error": None,
+        "solution": ShiftSchedule(employees=[employee], shifts=[shift]),
+    }
+
+
+def test_save_and_get_job(job_store):
+    """Test saving a job and loading it back as domain objects"""
+    job_store.save_job("job1", _completed_job())
+
+    job = job_store.get_job("job1")
+
+    assert job is not None
+    assert job["status"] == "SOLVING_COMPLETED"
+    assert job["created_at"] == datetime(2025, 6, 1, 9, 0)
+    solution = job["solution"]
+    assert [emp.id for emp in solution.employees] == ["emp1"]
+    assert solution.shifts[0].employee.id == "emp1"
+
+
+def test_reloaded_job_keeps_its_etag(job_store):
+    """Test that a job changed after completion reloads under its latest ETag"""
+    updated_at = datetime(2025, 6, 1, 10, 30, 15, 123456)
+    etag = _solution_etag("job1", updated_at)
+    job_store.save_job(
+        "job1", {**_completed_job(), "updated_at": updated_at, "etag": etag}
+    )
+
+    job = job_store.get_job("job1")
+
+    assert job["updated_at"] == updated_at
+    assert solution_etag("job1", job) == etag
+
+
+def test_get_missing_job(job_store):
+    """Test that a missing job loads as None"""
+    assert job_store.get_job("missing") is None
+
+
+def test_iter_job_summaries(job_store):
+    """Test listing job summaries without rebuilding solutions"""
+    job_store.save_job("job1", _completed_job())
+
+    summaries = dict(job_store.iter_job_summaries())
+
+    assert summaries == {
+        "job1": {
+            "status": "SOLVING_COMPLETED",
+            "created_at": datetime(2025, 6, 1, 9, 0),
+            "completed_at": datetime(2025, 6, 1, 9, 5),
+        }
+    }
+
+
+def test_load_stored_jobs_reads_each_file_once(job_store, monkeypatch):
+    """Test that loading jobs reuses the data read for their summaries"""
+    job_store.save_job("done", _completed_job())
+    job_store.save_job("running", {**_completed_job(), "status": "SOLVING_ACTIVE"})
+
+    loads = []
+    real_load = json.load
+
+    def counting_load(f):
+        loads.append(f.name)
+        return real_load(f)
+
+    monkeypatch.setattr(json, "load", counting_load)
+    loaded = {
+        job_id: (summary, job)
+        for job_id, summary, job in job_store.load_stored_jobs({"SOLVING_COMPLETED"})
+    }
+
+    assert len(loads) == 2
+    assert loaded["running"] == (
+        {
+            "status": "SOLVING_ACTIVE",
+            "created_at": datetime(2025, 6, 1, 9, 0),
+            "completed_at": datetime(2025, 6, 1, 9, 5),
+        },
+        None,
+    )
+    summary, job = loaded["done"]
+    assert summary["status"] == "SOLVING_COMPLETED"
+    assert job["created_at"] == datetime(2025, 6, 1, 9, 0)
+    assert job["solution"].shifts[0].employee.id == "emp1"
@@ -0,0 +1,201 @@
+"""
+Tests for job management
+"""
+
+import threading
+import time
+
+from src.shiftagent.api import jobs as jobs_module
+from src.shiftagent.api.jobs import (
+    _buffered_sync,
+    _lock_for,
+    _sync_job_to_store,
+    _update_job,
+    add_employees_to_completed_job,
+    evict_idle_jobs,
+    flush_job_syncs,
+    start_store_writer,
+    stop_store_writer,
+    sync_job,
+    wait_for_job,
+)
+from src.shiftagent.core.models import Employee, ShiftSchedule
+
+
+async def test_wait_for_job_times_out_while_solving(make_job):
+    """Test that waiting on a running job returns it once the timeout passes"""
+    job_id = make_job("SOLVING_ACTIVE")
+
+    job = await wait_for_job(job_id, 0.05)
+
+    assert job is not None
+    assert job["status"] == "SOLVING_ACTIVE"
+
+
+async def test_wait_for_job_returns_on_completion(make_job):
+    """Test that a status change on another thread ends the wait early"""
+    job_id = make_job("SOLVING_ACTIVE")
+
+    def complete():
+        with _lock_for(job_id):
+            _update_job(job_id, status="SOLVING_COMPLETED")
+
+    threading.Timer(0.05, complete).start()
+    started = time.monotonic()
+    job = await wait_for_job(job_id, 10)
+
+    assert job is not None
+    assert job["status"] == "SOLVING_COMPLETED"
+    assert time.monotonic() - started < 5
+
+
+async def test_wait_for_finished_job_returns_immediately(make_job):
+    """Test that a finished job is returned without waiting"""
+    job_id = make_job("SOLVING_FAILED")
+
+    job = await wait_for_job(job_id, 10)
+
+    assert job is not None
+    assert job["status"] == "SOLVING_FAILED"
+
+
+async def test_wait_for_missing_job():
+    """Test that waiting on an unknown job returns None"""
+    assert await wait_for_job("nonexistent_job_id", 10) is None
+
+
+def test_buffered_syncs_reach_store(make_job, recording_store):
+    """Test that a buffered operation's syncs collapse into one store write"""
+    job_id = make_job("SOLVING_COMPLETED")
+
+    @_buffered_sync
+    def update_twice(job_id: str) -> None:
+        for step in (1, 2):
+            with _lock_for(job_id):
+                _update_job(job_id, step=step)
+            _sync_job_to_store(job_id)
+
+    update_twice(job_id)
+    flush_job_syncs()
+
+    assert recording_store.writes == [job_id]
+    assert recording_store.saved[job_id]["step"] == 2
+
+
+def test_store_writer_writes_queued_jobs(make_job, recording_store):
+    """Test that the writer thread saves queued jobs before it stops"""
+    job_id = make_job("SOLVING_COMPLETED")
+
+    start_store_writer()
+    try:
+        sync_job(job_id)
+    finally:
+        stop_store_writer()
+
+    assert recording_store.writes == [job_id]
+    assert recording_store.saved[job_id]["status"] == "SOLVING_COMPLETED"
+
+
+def test_add_employees_without_valid_employees_leaves_job(make_job):
+    """Test that a batch with only rejected employees does not touch the job"""
+    existing = Employee("emp1", "John Smith", {"Nurse"})
+    job_id = make_job(
+        "SOLVING_COMPLETED",
+        solution=ShiftSchedule(employees=[existing], shifts=[]),
+    )
+
+    success, result = add_employees_to_completed_job(
+        job_id, [Employee("emp1", "Duplicate", {"Nurse"})]
+    )
+
+    assert success is True
+    assert result["skipped_additions"] == 1
+    assert result["results"][0]["status"] == "SKIPPED"
+    job = jobs_module.get_job(job_id)
+    assert job["status"] == "SOLVING_COMPLETED"
+    assert "batch_employee_additions" not in job
+
+
+def test_add_employees_without_auto_assign(make_job):
+    """Test that valid employees are added and duplicates in the batch rejected"""
+    existing = Employee("emp1", "John Smith", {"Nurse"})
+    job_id = make_job(
+        "SOLVING_COMPLETED",
+        solution=ShiftSchedule(employees=[existing], shifts=[]),
+    )
+
+    success, result = add_employees_to_completed_job(
+        job_id,
+        [
+            Employee("emp2", "Sarah Johnson", {"Nurse"}),
+            Employee("emp2", "Sarah Again", {"Nurse"}),
+        ],
+    )
+
+    assert success is True
+    assert [r["status"] for r in result["results"]] == ["SUCCESS", "FAILED"]
+    assert result["successful_additions"] == 1
+    assert result["failed_additions"] == 1
+    job = jobs_module.get_job(job_id)
+    assert job["status"] == "SOLVING_COMPLETED"
+    assert [emp.id for emp in job["solution"].employees] == ["emp1", "emp2"]
+    assert len(job["batch_employee_additions"]) == 1
+
+
+def test_eviction_drops_least_recently_accessed_job(
+    make_job, recording_store, monkeypatch
+):
+    """Test that going over capacity evicts the finished job idle the longest"""
+    active = make_job("SOLVING_ACTIVE")
+    stale = make_job("SOLVING_COMPLETED")
+    recent = make_job("SOLVING_FAILED")
+    now = time.monotonic()
+    jobs_module._last_access.update({active: 0.0, stale: now - 60, recent: now})
+    monkeypatch.setattr(jobs_module, "MAX_JOBS", len(jobs_module.jobs) - 1)
+
+    assert evict_idle_jobs() == 1
+
+    assert stale not in jobs_module.jobs
+    assert active in jobs_module.jobs
+    assert recent in jobs_module.jobs
+
+
+def test_eviction_keeps_active_jobs(make_job, recording_store, monkeypatch):
+    """Test that active jobs stay in memory however idle or over capacity"""
+    active = make_job("SOLVING_ACTIVE")
+    scheduled = make_job("SOLVING_SCHEDULED")
+    finished = make_job("SOLVING_COMPLETED")
+    jobs_module._last_access.update({active: 0.0, scheduled: 0.0, finished: 0.0})
+    monkeypatch.setattr(jobs_module, "MAX_JOBS", 0)
+    monkeypatch.setattr(jobs_module, "JOB_TTL_SECONDS", 0)
+
+    evict_idle_jobs()
+
+    assert finished not in jobs_module.jobs
+    assert active in jobs_module.jobs
+    assert scheduled in jobs_module.jobs
+
+
+def test_eviction_skips_jobs_with_deferred_syncs(
+    make_job, recording_store, monkeypatch
+):
+    """Test that a job is not evicted before its buffered update is written"""
+    job_id = make_job("SOLVING_COMPLETED")
+    monkeypatch.setattr(jobs_module, "MAX_JOBS", 0)
+    monkeypatch.setattr(jobs_module, "JOB_TTL_SECONDS", 0)
+
+    @_buffered_sync
+    def publish_then_evict(job_id: str) -> None:
+        with _lock_for(job_id):
+            _update_job(job_id, step=1)
+        _sync_job_to_store(job_id)
+        # Eviction runs on another thread while the write is still buffered
+        thread = threading.Thread(target=evict_idle_jobs)
+        thread.start()
+        thread.join()
+        assert job_id in jobs_module.jobs
+
+    publish_then_evict(job_id)
+    flush_job_syncs()
+
+    assert recording_store.saved[job_id]["step"] == 1
@@ -1,34 +1,29 @@
 #!/usr/bin/env python3
-"""Test MCP server connection to API"""
-
-import asyncio
-import os
+"""Test the API endpoints used by the MCP server"""
 
 import httpx
 import pytest
 
-API_URL = os.getenv("SHIFTAGENT_API_URL", "http://localhost:8081")
+from src.shiftagent.api.app import app
 
 
-@pytest.mark.asyncio
 async def test_connection():
-    print(f"Testing connection to API at: {API_URL}")
-
-    try:
-        async with httpx.AsyncClient() as client:
-            # Test health endpoint
-            response = await client.get(f"{API_URL}/health")
-            print(f"Health check status: {response.status_code}")
-            print(f"Response: {response.json()}")
-
-            # Test demo endpoint
-            response = await client.get(f"{API_URL}/api/shifts/demo")
-            print(f"\nDemo endpoint status: {response.status_code}")
-            print(f"Demo data keys: {list(response.json().keys())}")
-
-    except Exception as e:
-        print(f"Error: {type(e).__name__}: {e}")
+    # Dispatch requests to the app in-process, without a running server
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        # Test health endpoint
+        response = await client.get("/health")
+        print(f"Health check status: {response.status_code}")
+        print(f"Response: {response.json()}")
+        assert response.status_code == 200
+
+        # Test demo endpoint
+        response = await client.get("/api/shifts/demo")
+        print(f"\nDemo endpoint status: {response.status_code}")
+        print(f"Demo data keys: {list(response.json().keys())}")
+        assert response.status_code == 200
 
 
 if __name__ == "__main__":
-    asyncio.run(test_connection())
+    pytest.main([__file__, "-v"])
@@ -16,6 +16,7 @@ def test_employee_creation():
     assert employee.id == "emp1"
     assert employee.name == "John Smith"
     assert employee.skills == {"Nurse"}
+    assert isinstance(employee.skills, frozenset)
 
 
 def test_employee_skill_check():
@@ -45,6 +46,16 @@ def test_shift_creation():
     assert shift.employee is None
 
 
+def test_shift_skills_shared():
+    """Test that shifts with equal required skills share one frozenset"""
+    start_time = datetime(2025, 6, 1, 9, 0)
+    end_time = start_time + timedelta(hours=8)
+    shift1 = Shift("shift1", start_time, end_time, {"Nurse", "CPR"})
+    shift2 = Shift("shift2", start_time, end_time, ["CPR", "Nurse"])
+    assert isinstance(shift1.required_skills, frozenset)
+    assert shift1.required_skills is shift2.required_skills
+
+
 def test_shift_pinning_functionality():
     """Test basic pinning functionality for shifts"""
     # Create a shift
@@ -189,6 +200,14 @@ def test_week_key_generation():
     assert get_week_key(date3) == "2025-W23"
 
 
+def test_week_key_cached():
+    """Test that shifts on the same day share one week key"""
+    morning = get_week_key(datetime(2025, 6, 2, 9, 0))
+    evening = get_week_key(datetime(2025, 6, 2, 18, 0))
+    assert morning == "2025-W23"
+    assert morning is evening
+
+
 def test_employee_type_detection():
     """Test for employee type detection"""
     full_time_emp = Employee("emp1", "John Smith", {"Nurse", "Full-time"})
@@ -248,6 +267,7 @@ def test_schedule_statistics(sample_schedule):
 
     assert schedule.get_assigned_shift_count() == 1
     assert schedule.get_unassigned_shift_count() == 1
+    assert schedule.get_assignment_counts() == (1, 1)
 
 
 def test_employee_preferences():
@@ -98,6 +98,18 @@ def test_demo_data_with_preferences():
     assert len(sato.unavailable_dates) > 0
 
 
+def test_demo_schedule_copies():
+    """Test that demo schedules are copies unless the shared one is requested"""
+    from shiftagent.utils.demo_data import create_demo_schedule
+
+    schedule = create_demo_schedule()
+    schedule.employees.clear()
+
+    assert create_demo_schedule().employees
+    assert create_demo_schedule(shared=True) is create_demo_schedule(shared=True)
+    assert create_demo_schedule() is not create_demo_schedule(shared=True)
+
+
 def test_constraint_helper_functions():
     """Test constraint helper functions"""
     from shiftagent.core.constraints.shift_constraints import get_day_name
@@ -135,3 +147,15 @@ def test_employee_preference_edge_cases():
     # Test no conflicts
     assert not employee.prefers_day_off("monday")
     assert not employee.prefers_work_day("friday")
+
+
+def test_get_next_monday():
+    """Test next Monday calculation from a fixed reference time"""
+    from shiftagent.utils.demo_data import get_next_monday
+
+    # Wednesday -> following Monday
+    assert get_next_monday(datetime(2024, 1, 17, 10, 30)) == datetime(2024, 1, 22, 9)
+    # Monday morning -> same day
+    assert get_next_monday(datetime(2024, 1, 15, 8)) == datetime(2024, 1, 15, 9)
+    # Monday evening -> next week
+    assert get_next_monday(datetime(2024, 1, 15, 19)) == datetime(2024, 1, 22, 9)
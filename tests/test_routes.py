@@ -0,0 +1,159 @@
+"""
+Tests for the API route handlers
+"""
+
+from concurrent.futures import Future
+from datetime import datetime
+
+import httpx
+import orjson
+import pytest
+
+from src.shiftagent.api import routes as routes_module
+from src.shiftagent.api.app import app
+from src.shiftagent.api.converters import convert_domain_to_response
+from src.shiftagent.api.jobs import add_employees_to_completed_job, get_job
+from src.shiftagent.api.schemas import SolutionResponse
+from src.shiftagent.core.models import Employee, Shift, ShiftSchedule
+
+
+@pytest.fixture
+async def client():
+    """Dispatch requests to the app in-process, without a running server"""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def no_job_store(monkeypatch):
+    """Keep route handlers away from persistent storage"""
+    monkeypatch.setattr(routes_module, "job_store", None)
+
+
+def _solved_schedule() -> ShiftSchedule:
+    """Build a schedule with one employee assigned to one shift"""
+    employee = Employee("emp1", "John Smith", {"Nurse"})
+    shift = Shift(
+        "shift1",
+        datetime(2025, 6, 2, 9, 0),
+        datetime(2025, 6, 2, 17, 0),
+        {"Nurse"},
+        "Hospital",
+    )
+    shift.employee = employee
+    return ShiftSchedule(employees=[employee], shifts=[shift])
+
+
+@pytest.fixture
+def completed_job(make_job):
+    """Register a completed job with a solved schedule"""
+    return make_job(
+        "SOLVING_COMPLETED",
+        completed_at=datetime(2025, 6, 1, 9, 5),
+        solution=_solved_schedule(),
+    )
+
+
+async def test_streamed_solution_matches_response_model(client, completed_job):
+    """Test that the streamed solution is byte-identical to the model response"""
+    solution = get_job(completed_job)["solution"]
+    expected = SolutionResponse(
+        job_id=completed_job,
+        status="SOLVING_COMPLETED",
+        solution=convert_domain_to_response(solution),
+        score=str(solution.score),
+        assigned_shifts=solution.get_assigned_shift_count(),
+        unassigned_shifts=solution.get_unassigned_shift_count(),
+        html_report_url=f"/api/shifts/solve/{completed_job}/html",
+    )
+
+    response = await client.get(f"/api/shifts/solve/{completed_job}")
+
+    assert response.status_code == 200
+    assert response.content == orjson.dumps(expected.model_dump())
+
+
+async def test_get_solution_not_modified(client, completed_job):
+    """Test that a matching If-None-Match header returns 304 without a body"""
+    response = await client.get(f"/api/shifts/solve/{completed_job}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    response = await client.get(
+        f"/api/shifts/solve/{completed_job}", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+async def test_get_solution_etag_changes_with_solution(
+    client, completed_job, recording_store
+):
+    """Test that a changed solution is sent again under a new ETag"""
+    response = await client.get(f"/api/shifts/solve/{completed_job}")
+    etag = response.headers["etag"]
+
+    success, _ = add_employees_to_completed_job(
+        completed_job, [Employee("emp2", "Sarah Johnson", {"Nurse"})]
+    )
+    assert success is True
+
+    response = await client.get(
+        f"/api/shifts/solve/{completed_job}", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    employee_ids = [emp["id"] for emp in response.json()["solution"]["employees"]]
+    assert employee_ids == ["emp1", "emp2"]
+
+
+@pytest.mark.parametrize("timeout", ["nan", "inf"])
+async def test_wait_rejects_non_finite_timeout(client, completed_job, timeout):
+    """Test that the long-poll refuses NaN and infinite timeouts"""
+    response = await client.get(
+        f"/api/shifts/solve/{completed_job}/wait", params={"timeout": timeout}
+    )
+
+    assert response.status_code == 422
+
+
+async def test_delete_queued_job_cancels_it(client, make_job, no_job_store):
+    """Test that deleting a job still waiting in the queue cancels its solve"""
+    future: Future[None] = Future()
+    job_id = make_job("SOLVING_SCHEDULED", future=future)
+
+    response = await client.delete(f"/api/jobs/{job_id}")
+
+    assert response.status_code == 200
+    assert future.cancelled()
+    assert get_job(job_id) is None
+
+
+async def test_delete_running_job_is_refused(client, make_job, no_job_store):
+    """Test that a job whose solve already started cannot be deleted"""
+    future: Future[None] = Future()
+    future.set_running_or_notify_cancel()
+    job_id = make_job("SOLVING_ACTIVE", future=future)
+
+    response = await client.delete(f"/api/jobs/{job_id}")
+
+    assert response.status_code == 400
+    assert get_job(job_id) is not None
+
+
+async def test_delete_solving_job_without_future_is_refused(
+    client, make_job, no_job_store
+):
+    """Test that an active job with a solver but no future cannot be deleted"""
+    job_id = make_job("SOLVING_ACTIVE", solver=object())
+
+    response = await client.delete(f"/api/jobs/{job_id}")
+
+    assert response.status_code == 400
+    assert get_job(job_id) is not None